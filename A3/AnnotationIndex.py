@@ -0,0 +1,276 @@
+# Import Libraries
+import numpy as np  # Computation
+import pandas as pd  # Data Reading
+
+metadata = {
+    'Author      ': 'Jay Annadurai',
+    'Date        ': '17 Oct 2026',
+    'Project     ': 'AnnotationIndex',
+    'Version     ': 1.0,
+    'Description ': "Sorted Interval Index of Genome Annotations for Jay Annadurai's Scripts"
+}
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+#  Annotation Index Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class AnnotationIndex:
+    """
+    Interval index of the features of a parsed PTT or GFF frame for bulk range queries.
+
+    The features are grouped by contig and strand and sorted by start position within each group.
+    Every group is laid out on a single number line by offsetting its positions by the group number times a
+    stride longer than any contig, so one searchsorted call answers the queries of every group at once.
+    A running maximum of the end positions bounds the first feature that can still overlap a query,
+    so an overlap query costs O(log n) plus the features between that bound and the query end.
+    """
+
+    def __init__(
+            self,
+            df: pd.DataFrame,
+            contig_column: str = None,
+            direction_column: str = 'Strand',
+            pos_start_column: str = 'Pos_Start',
+            pos_end_column: str = 'Pos_End'
+    ):
+        """
+        Builds the index from a frame of features with start and end positions.
+
+        :param df: The feature table, such as a parsed PTT or GFF frame.
+        :param contig_column: The column of the contig of each feature. None for single sequence genomes (PTT).
+        :param direction_column: The column of the strand of each feature, '+' or '-'.
+        :param pos_start_column: The column of the feature start positions.
+        :param pos_end_column: The column of the feature end positions.
+        """
+        self.df = df
+
+        # Contig and strand of every feature
+        contigs = df[contig_column] if contig_column is not None else pd.Series('', index=df.index)
+        strands = df[direction_column]
+
+        # Number the (contig, strand) groups
+        self.groups = pd.MultiIndex.from_arrays([contigs, strands], names=['Contig', 'Strand']).unique()
+        group_codes = self.groups.get_indexer(pd.MultiIndex.from_arrays([contigs, strands]))
+
+        pos_starts = df[pos_start_column].to_numpy(dtype=np.int64)
+        pos_ends = df[pos_end_column].to_numpy(dtype=np.int64)
+
+        # Stride separating the groups on the shared number line
+        self.stride = int(max(pos_ends.max(initial=0), pos_starts.max(initial=0))) + 2
+
+        # Features sorted by group and start position
+        self.start_order = np.lexsort((pos_starts, group_codes))
+        self.start_keys = group_codes[self.start_order] * self.stride + pos_starts[self.start_order]
+        self.end_keys_by_start = group_codes[self.start_order] * self.stride + pos_ends[self.start_order]
+
+        # Running maximum of the ends, and the sorted position of the feature reaching it
+        self.max_end_keys = np.maximum.accumulate(self.end_keys_by_start)
+        self.max_end_positions = np.maximum.accumulate(
+            np.where(self.end_keys_by_start == self.max_end_keys, np.arange(len(df)), 0)
+        )
+
+        # Features sorted by group and end position, for the nearest feature before a position
+        self.end_order = np.lexsort((pos_ends, group_codes))
+        self.end_keys = group_codes[self.end_order] * self.stride + pos_ends[self.end_order]
+
+        # Unoffset positions in both sort orders, for the distances to query positions
+        self.sorted_starts = pos_starts[self.start_order]
+        self.sorted_ends = pos_ends[self.end_order]
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Query Preparation Methods     #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    def _query_groups(self, query_count: int, contigs, strands) -> list:
+        # Returns a (strand, group code per query) pair for each strand the queries are run against
+        # Queries without a strand are run against both strands, unknown contigs get the group code -1
+        if contigs is None:
+            contigs = [''] * query_count
+        elif isinstance(contigs, str):
+            contigs = [contigs] * query_count
+
+        if strands is None:
+            query_strands = [('+', ['+'] * query_count), ('-', ['-'] * query_count)]
+        elif isinstance(strands, str):
+            query_strands = [(strands, [strands] * query_count)]
+        else:
+            query_strands = [(None, list(strands))]
+
+        return [
+            (strand, self.groups.get_indexer(pd.MultiIndex.from_arrays([list(contigs), strand_values])))
+            for strand, strand_values in query_strands
+        ]
+
+    def _keys(self, group_codes: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        # Places query positions of each group on the shared number line, clipped within the group
+        positions = np.clip(np.asarray(positions, dtype=np.int64), -1, self.stride - 1)
+        return group_codes.astype(np.int64) * self.stride + positions
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Range Query Methods           #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    def overlaps(self, starts, ends, contigs=None, strands=None) -> pd.DataFrame:
+        """
+        Finds every feature overlapping each query range in bulk. Positions are inclusive, as in PTT and GFF files.
+
+        :param starts: The start positions of the query ranges.
+        :param ends: The end positions of the query ranges.
+        :param contigs: The contig of each query, or one contig for all. None for single sequence genomes.
+        :param strands: The strand of each query, or one strand for all. None searches both strands.
+        :return: A DataFrame with a row per overlap of the 'Query' position and the 'Feature' row position in df,
+            sorted by query and then feature start position.
+        """
+        starts = np.atleast_1d(np.asarray(starts, dtype=np.int64))
+        ends = np.atleast_1d(np.asarray(ends, dtype=np.int64))
+
+        query_ids = []
+        feature_positions = []
+
+        for _, group_codes in self._query_groups(len(starts), contigs, strands):
+            known = group_codes >= 0
+            start_keys = self._keys(group_codes, starts)
+            end_keys = self._keys(group_codes, ends)
+
+            # Candidates run from the first feature whose running max end reaches the query start
+            # to the last feature starting at or before the query end
+            lower = np.searchsorted(self.max_end_keys, start_keys, side='left')
+            upper = np.searchsorted(self.start_keys, end_keys, side='right')
+            counts = np.where(known, np.maximum(upper - lower, 0), 0)
+
+            # Expand the candidate ranges of every query into flat arrays
+            candidate_queries = np.repeat(np.arange(len(starts)), counts)
+            range_offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            candidates = np.repeat(lower, counts) + range_offsets
+
+            # Keep the candidates that end at or after the query start
+            overlapping = self.end_keys_by_start[candidates] >= start_keys[candidate_queries]
+            query_ids.append(candidate_queries[overlapping])
+            feature_positions.append(candidates[overlapping])
+
+        query_ids = np.concatenate(query_ids)
+        sorted_positions = np.concatenate(feature_positions)
+
+        # Order by query, then by group and start position
+        order = np.lexsort((sorted_positions, query_ids))
+
+        return pd.DataFrame({
+            'Query': query_ids[order],
+            'Feature': self.start_order[sorted_positions[order]]
+        })
+
+    def within(self, positions, distance: int, contigs=None, strands=None) -> pd.DataFrame:
+        """
+        Finds every feature within a distance of each query position, such as genes near motif hits.
+
+        :param positions: The query positions.
+        :param distance: The maximum distance in bp between the position and the feature.
+        :param contigs: The contig of each query, or one contig for all. None for single sequence genomes.
+        :param strands: The strand of each query, or one strand for all. None searches both strands.
+        :return: A DataFrame with a row per feature in range of the 'Query' position and the 'Feature' row position.
+        """
+        positions = np.atleast_1d(np.asarray(positions, dtype=np.int64))
+        return self.overlaps(positions - distance, positions + distance, contigs=contigs, strands=strands)
+
+    def nearest(self, positions, contigs=None, strands=None, direction: str = 'any') -> pd.DataFrame:
+        """
+        Finds the nearest feature of each query position in bulk.
+        Upstream and downstream follow the reading direction of the query strand:
+        upstream of a '+' position is towards lower coordinates and upstream of a '-' position is towards higher ones.
+
+        :param positions: The query positions.
+        :param contigs: The contig of each query, or one contig for all. None for single sequence genomes.
+        :param strands: The strand of each query, or one strand for all. None searches both strands.
+        :param direction: 'any' for the nearest feature on either side, including a feature containing the position,
+            'upstream' or 'downstream' for the nearest feature entirely before or after it.
+        :return: A DataFrame with a row per query of the 'Query' position, the 'Feature' row position (-1 if none)
+            and the 'Distance' in bp to the nearest end of the feature.
+        """
+        if direction not in ['any', 'upstream', 'downstream']:
+            raise ValueError(f"Unsupported direction {direction}, try: ['any', 'upstream', 'downstream']")
+
+        positions = np.atleast_1d(np.asarray(positions, dtype=np.int64))
+        query_count = len(positions)
+        no_feature = np.iinfo(np.int64).max
+
+        best_features = np.full(query_count, -1, dtype=np.int64)
+        best_distances = np.full(query_count, no_feature, dtype=np.int64)
+
+        # Error Handler for an empty index
+        if len(self.start_keys) == 0:
+            return pd.DataFrame({'Query': np.arange(query_count), 'Feature': best_features, 'Distance': -1})
+
+        for strand, group_codes in self._query_groups(query_count, contigs, strands):
+            known = group_codes >= 0
+            keys = self._keys(group_codes, positions)
+            group_floor = group_codes.astype(np.int64) * self.stride
+            candidates = []
+
+            # Strand of each query, deciding which side is upstream
+            if strand is None:
+                reverse = np.asarray(strands) == '-'
+            else:
+                reverse = np.full(query_count, strand == '-')
+
+            # Nearest feature ending before the position
+            before = np.searchsorted(self.end_keys, keys, side='left') - 1
+            before_valid = known & (before >= 0)
+            before_valid[before_valid] &= self.end_keys[before[before_valid]] >= group_floor[before_valid]
+            before_features = np.where(before_valid, self.end_order[np.maximum(before, 0)], -1)
+            before_distances = np.where(
+                before_valid, positions - self.sorted_ends[np.maximum(before, 0)], no_feature
+            )
+
+            # Nearest feature starting after the position
+            after = np.searchsorted(self.start_keys, keys, side='right')
+            after_valid = known & (after < len(self.start_keys))
+            after_valid[after_valid] &= self.start_keys[after[after_valid]] < group_floor[after_valid] + self.stride
+            after_features = np.where(
+                after_valid, self.start_order[np.minimum(after, len(self.start_keys) - 1)], -1
+            )
+            after_distances = np.where(
+                after_valid, self.sorted_starts[np.minimum(after, len(self.start_keys) - 1)] - positions, no_feature
+            )
+
+            if direction == 'any':
+                candidates += [(before_features, before_distances), (after_features, after_distances)]
+
+                # A feature starting at or before the position with the largest end contains it if that end reaches it
+                last_start = np.searchsorted(self.start_keys, keys, side='right') - 1
+                contained = known & (last_start >= 0)
+                contained[contained] &= self.max_end_keys[last_start[contained]] >= keys[contained]
+                containing = self.max_end_positions[np.maximum(last_start, 0)]
+                candidates.append((
+                    np.where(contained, self.start_order[containing], -1),
+                    np.where(contained, 0, no_feature)
+                ))
+            else:
+                # Upstream is before the position on '+' and after it on '-'
+                upstream = direction == 'upstream'
+                take_before = reverse != upstream
+                candidates.append((
+                    np.where(take_before, before_features, after_features),
+                    np.where(take_before, before_distances, after_distances)
+                ))
+
+            # Keep the closest candidate of every query
+            for features, distances in candidates:
+                closer = distances < best_distances
+                best_features = np.where(closer, features, best_features)
+                best_distances = np.where(closer, distances, best_distances)
+
+        return pd.DataFrame({
+            'Query': np.arange(query_count),
+            'Feature': best_features,
+            'Distance': np.where(best_features >= 0, best_distances, -1)
+        })
+
+    def features(self, feature_positions) -> pd.DataFrame:
+        """
+        Returns the rows of the indexed frame at the given row positions, as returned by the queries.
+
+        :param feature_positions: The row positions of the features.
+        :return: The matching rows of the indexed DataFrame.
+        """
+        return self.df.iloc[np.asarray(feature_positions)]
@@ -0,0 +1,38 @@
+metadata = {
+    'Author      ': 'Jay Annadurai',
+    'Date        ': '17 Oct 2026',
+    'Project     ': 'A3-Operons',
+    'Version     ': 1.0,
+    'Description ': 'Predicts the operons of a batch of genome annotation files across a process pool'
+}
+
+# Import Libraries for Adjusting the System Path
+import sys
+import os
+
+# Temporary adjustment to the system path to ensure the JayUtilities and OperonPredictor modules can be imported
+script_dir = os.getcwd()  # Gets the directory where the script is located
+sys.path.append(script_dir)
+
+# Import DataIO as Jio from JayUtilities and the Operon Predictor
+from JayUtilities import DataIO as Jio
+from OperonPredictor import OperonPredictor as Op
+
+# Batch Config
+batch_source = 'Input'  # Folder of PTT/GFF files (optionally .gz or .bz2), or a manifest file of one path per line
+batch_output_folder = os.path.join('Output', 'Batch')  # Folder to save the predicted operons of each genome in
+max_workers = None  # Number of worker processes, defaults to the CPU count
+within_operon_dist = 50  # Maximum distance in bp between adjacent genes of the same operon
+
+if __name__ == '__main__':
+    # Predict every genome, each written to the output folder as it finishes
+    timings_df = Op.predict_genomes(
+        source=batch_source,
+        output_folder=batch_output_folder,
+        max_workers=max_workers,
+        within_operon_dist=within_operon_dist
+    )
+
+    # Save and show the per-genome timings
+    Jio.df_to_file(df=timings_df, file_name='BatchTimings', file_format='tsv', folder=batch_output_folder)
+    Jio.print_df(timings_df, df_name='Batch Operon Prediction Timings', rows=len(timings_df))
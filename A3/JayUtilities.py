@@ -1,15 +1,17 @@
 # Import Libraries
 import os  # File Manipulation
+import csv  # Quoting Options for Delimited Files
 import gzip  # File Compression
 import shutil  # File Data Transfer
 import numpy as np  # Computation
 import pandas as pd  # Data Reading
+from urllib.parse import unquote  # Decoding of Escaped GFF Attribute Values
 
 metadata = {
     'Author      ': 'Jay Annadurai',
-    'Date        ': '22 Mar 2024',
+    'Date        ': '17 Oct 2026',
     'Project     ': 'JayUtilities',
-    'Version     ': 1.1,
+    'Version     ': 1.2,
     'Description ': "Contains Utility Functions as used by Jay Annadurai's Scripts"
 }
 
@@ -24,6 +26,13 @@ class DataIO:
     output_folder = 'Output'
     # Supported File Formats
     file_formats = ['txt', 'csv', 'tsv', 'xlsx', 'xls']
+    # Columns of GFF3 files, and the repetitive columns stored as categoricals
+    gff_columns = ['Contig', 'Source', 'Type', 'Pos_Start', 'Pos_End', 'Score', 'Strand', 'Phase', 'Attributes']
+    gff_categorical_columns = ['Contig', 'Source', 'Type', 'Score', 'Strand', 'Phase', 'product']
+    # Repetitive columns of PTT files stored as categoricals
+    ptt_categorical_columns = ['Strand', 'Code', 'COG']
+    # Position columns stored as int32 when their values fit
+    position_columns = ['Pos_Start', 'Pos_End']
 
     # ~~~~~~~~~~~~~~~~~~~~~ #
     #  File <-> DF Methods  #
@@ -36,7 +45,8 @@ class DataIO:
             include_df_shape: bool = True,
             alternate_forms: bool = False,
             force_encode_format: bool | str = False,
-            read_args: dict = None  # Dictionary for additional read arguments
+            read_args: dict = None,  # Dictionary for additional read arguments
+            folder: str = None
     ) -> pd.DataFrame | dict:
         """
         Loads a file from the input directory into a pandas DataFrame and returns a df or dictionary
@@ -50,12 +60,15 @@ class DataIO:
 
         Optional Read_Args include 'skiprows' to skip rows when parsing the file or 'header=None' to prevent headers
 
+        :param folder: The folder to load the file from. Defaults to the input folder.
         :return: A dictionary with the file and DataFrame information, or the DataFrame itself.
         """
         if read_args is None:
             read_args = {}
+        if folder is None:
+            folder = DataIO.input_folder
 
-        file_path = os.path.join(DataIO.input_folder, file_name)
+        file_path = os.path.join(folder, file_name)
         file_name, file_extension = os.path.splitext(file_name)
 
         # Remove the period from the file extension if it exists
@@ -129,7 +142,8 @@ class DataIO:
             file_format: str,
             keep_header: bool = True,
             keep_index: bool = False,
-            save_args: dict = None  # Additional arguments for saving the file
+            save_args: dict = None,  # Additional arguments for saving the file
+            folder: str = None
     ) -> None:
         """
         Saves a pandas DataFrame to a file in the output directory in the specified format.
@@ -140,6 +154,7 @@ class DataIO:
         :param keep_header: If True, include the header in the output file; otherwise, no header is written.
         :param keep_index: If True, include the index in the output file; otherwise, no index is written.
         :param save_args: Optional dictionary to specify additional arguments for saving the file.
+        :param folder: The folder to save the file in. Defaults to the output folder.
         :return: None
         """
         if not isinstance(df, pd.DataFrame):
@@ -154,7 +169,10 @@ class DataIO:
         if file_format not in DataIO.file_formats:
             raise ValueError(f"Unsupported file format. Choose from {DataIO.file_formats}")
 
-        file_path = os.path.join(DataIO.output_folder, f"{file_name}.{file_format}")
+        if folder is None:
+            folder = DataIO.output_folder
+
+        file_path = os.path.join(folder, f"{file_name}.{file_format}")
 
         # Saving the DataFrame to the file using the specified format
         if file_format in ['xlsx', 'xls']:
@@ -166,6 +184,220 @@ class DataIO:
         else:
             raise ValueError("Unexpected error in saving the file.")
 
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  File -> Annotation Methods  #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def read_ptt(
+            file_name: str,
+            header_rows: int = 2,
+            compact_dtypes: bool = True,
+            categorical_columns: list = None,
+            folder: str = None,
+            return_memory_report: bool = False
+    ) -> pd.DataFrame | dict:
+        """
+        Reads a Protein Table (PTT) file from the input directory, parsing its Location into Pos_Start and Pos_End.
+
+        :param file_name: The name of the PTT file to be loaded from the input directory.
+        :param header_rows: The number of header lines before the column names. PTT files contain 2.
+        :param compact_dtypes: If True, stores the repetitive columns as categoricals and the positions as int32.
+        :param categorical_columns: The columns to store as categoricals when compacting.
+            Defaults to DataIO.ptt_categorical_columns ['Strand', 'Code', 'COG'].
+        :param folder: The folder to load the PTT file from. Defaults to the input folder.
+        :param return_memory_report: If True, also reports the memory of the DataFrame before and after compacting,
+            from the same read.
+        :return: A DataFrame with the PTT columns, Location replaced by Pos_Start and Pos_End.
+            With return_memory_report, a dictionary of the 'df' and its 'memory_report' as from memory_report.
+        """
+        if categorical_columns is None:
+            categorical_columns = DataIO.ptt_categorical_columns
+
+        df = DataIO.file_to_df(
+            file_name=file_name,
+            return_dict=False,
+            force_encode_format='tsv',
+            read_args={'skiprows': header_rows},
+            folder=folder
+        )
+
+        # Replace empty locations with a placeholder
+        df.loc[df['Location'] == '', 'Location'] = '0..0'
+
+        # Split the Location column into the start and end positions
+        df[['Pos_Start', 'Pos_End']] = df['Location'].str.extract(r'(\d+)\.\.(\d+)', expand=True).astype(int)
+        df = df.drop(columns=['Location'])
+
+        return DataIO._compact_read(df, compact_dtypes, categorical_columns, return_memory_report)
+
+    @staticmethod
+    def read_gff(
+            file_name: str,
+            attribute_keys: list = None,
+            keep_attributes: bool = False,
+            compact_dtypes: bool = True,
+            categorical_columns: list = None,
+            folder: str = None,
+            return_memory_report: bool = False
+    ) -> pd.DataFrame | dict:
+        """
+        Reads a GFF3 file from the input directory into a DataFrame with a column per attribute key.
+        The attributes are split into key/value pairs in one vectorized pass, so any key order or extra keys are kept.
+        Comment and directive lines (and any ##FASTA section) are skipped, and .gz or .bz2 files are read directly.
+
+        :param file_name: The name of the GFF file to be loaded from the input directory.
+        :param attribute_keys: Optionally, the attribute keys to keep as columns. Defaults to every key in the file.
+        :param keep_attributes: If True, keeps the raw Attributes column alongside the split attribute columns.
+        :param compact_dtypes: If True, stores the repetitive columns as categoricals and the positions as int32.
+        :param categorical_columns: The columns to store as categoricals when compacting.
+            Defaults to DataIO.gff_categorical_columns of the GFF columns and the 'product' attribute.
+        :param folder: The folder to load the GFF file from. Defaults to the input folder.
+        :param return_memory_report: If True, also reports the memory of the DataFrame before and after compacting,
+            from the same read.
+        :return: A DataFrame with the GFF columns followed by a column per attribute key, missing values as NaN.
+            With return_memory_report, a dictionary of the 'df' and its 'memory_report' as from memory_report.
+        """
+        if categorical_columns is None:
+            categorical_columns = DataIO.gff_categorical_columns
+        if folder is None:
+            folder = DataIO.input_folder
+
+        file_path = os.path.join(folder, file_name)
+
+        # Read every line as up to 9 tab separated fields, decompressing by the file extension
+        df = pd.read_csv(
+            file_path,
+            sep='\t',
+            header=None,
+            names=DataIO.gff_columns,
+            dtype=str,
+            quoting=csv.QUOTE_NONE,
+            compression='infer',
+            na_filter=False
+        ).fillna('')
+
+        # Keep only feature lines: directives, comments and FASTA lines lack the 9 fields or start with '#'
+        is_feature = (df['Attributes'] != '') & ~df['Contig'].str.startswith('#') & (df['Pos_End'] != '')
+        df = df[is_feature].reset_index(drop=True)
+
+        # Parse the positions as integers
+        df['Pos_Start'] = df['Pos_Start'].astype(np.int64)
+        df['Pos_End'] = df['Pos_End'].astype(np.int64)
+
+        # Split every attribute pair of every feature in one pass, the exploded index tracking the feature row
+        # The key, separator and value columns are set even for a file without features
+        attribute_pairs = df['Attributes'].str.split(';').explode()
+        pair_parts = attribute_pairs.str.partition('=').reindex(columns=range(3), fill_value='')
+        pairs = pd.DataFrame({'Key': pair_parts[0].str.strip(), 'Value': pair_parts[2]}).rename_axis('Row')
+
+        # Keep the keys in order of first appearance, or as requested
+        if attribute_keys is None:
+            attribute_keys = [key for key in pairs['Key'].unique() if key != '']
+        pairs = pairs[pairs['Key'].isin(attribute_keys)].reset_index()
+
+        # Keep the first value of any key repeated within a feature
+        pairs = pairs[~pairs.duplicated(['Row', 'Key'])]
+
+        # Percent-decode the escaped values as specified by GFF3
+        escaped = pairs['Value'].str.contains('%', regex=False)
+        if escaped.any():
+            pairs.loc[escaped, 'Value'] = pairs.loc[escaped, 'Value'].map(unquote)
+
+        # Pivot the values of each key into its column
+        attribute_df = pairs.pivot(index='Row', columns='Key', values='Value').reindex(
+            index=df.index, columns=attribute_keys
+        )
+        attribute_df.columns.name = None
+
+        if not keep_attributes:
+            df = df.drop(columns=['Attributes'])
+
+        df = pd.concat([df, attribute_df], axis='columns')
+
+        return DataIO._compact_read(df, compact_dtypes, categorical_columns, return_memory_report)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Dataframe Compaction Methods    #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def compact_dtypes(
+            df: pd.DataFrame,
+            categorical_columns: list = None,
+            integer_columns: list = None
+    ) -> pd.DataFrame:
+        """
+        Stores repetitive text columns as categoricals and downcasts integer columns to int32 where their values fit.
+        Columns missing from the DataFrame are skipped.
+
+        :param df: The DataFrame to compact.
+        :param categorical_columns: The columns to store as categoricals.
+        :param integer_columns: The integer columns to downcast to int32.
+        :return: The compacted DataFrame.
+        """
+        if categorical_columns is None:
+            categorical_columns = []
+        if integer_columns is None:
+            integer_columns = []
+
+        df = df.copy()
+
+        for column in categorical_columns:
+            if column in df.columns:
+                df[column] = df[column].astype('category')
+
+        # Only downcast when every value is within the int32 range
+        int32_range = np.iinfo(np.int32)
+        for column in integer_columns:
+            if column in df.columns and pd.api.types.is_integer_dtype(df[column]):
+                if df.empty or (df[column].min() >= int32_range.min and df[column].max() <= int32_range.max):
+                    df[column] = df[column].astype(np.int32)
+
+        return df
+
+    @staticmethod
+    def _compact_read(
+            df: pd.DataFrame,
+            compact_dtypes: bool,
+            categorical_columns: list,
+            return_memory_report: bool
+    ) -> pd.DataFrame | dict:
+        # Compacts a freshly read annotation DataFrame, optionally reporting its memory before and after
+        compact_df = DataIO.compact_dtypes(df, categorical_columns, DataIO.position_columns) if compact_dtypes else df
+
+        if return_memory_report:
+            return {'df': compact_df, 'memory_report': DataIO.memory_report(df, compact_df)}
+        return compact_df
+
+    @staticmethod
+    def memory_report(original_df: pd.DataFrame, compact_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Reports the memory of each column of a DataFrame before and after compacting its dtypes.
+
+        :param original_df: The DataFrame as loaded without compacting.
+        :param compact_df: The same DataFrame with compacted dtypes.
+        :return: A DataFrame of the dtypes and bytes of each column before and after, the bytes saved
+            and the reduction factor, with a final 'Total' row.
+        """
+        # Deep memory usage counts the bytes of the strings in object columns
+        original_bytes = original_df.memory_usage(deep=True)
+        compact_bytes = compact_df.memory_usage(deep=True).reindex(original_bytes.index)
+
+        report_df = pd.DataFrame({
+            'Original_Dtype': original_df.dtypes.astype(str).reindex(original_bytes.index).fillna(''),
+            'Compact_Dtype': compact_df.dtypes.astype(str).reindex(original_bytes.index).fillna(''),
+            'Original_Bytes': original_bytes,
+            'Compact_Bytes': compact_bytes
+        })
+        report_df.loc['Total'] = ['', '', original_bytes.sum(), compact_bytes.sum()]
+
+        report_df['Saved_Bytes'] = report_df['Original_Bytes'] - report_df['Compact_Bytes']
+        report_df['Reduction'] = (report_df['Original_Bytes'] / report_df['Compact_Bytes']).round(2)
+        report_df.index.name = 'Column'
+
+        return report_df
+
     # ~~~~~~~~~~~~~~~~~~~~~~ #
     #  File <-> Zip Methods  #
     # ~~~~~~~~~~~~~~~~~~~~~~ #
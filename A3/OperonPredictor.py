@@ -0,0 +1,622 @@
+# Import Libraries
+import os  # File Paths
+import time  # Per-Genome Timings
+from concurrent.futures import ProcessPoolExecutor, as_completed  # Parallel Genomes across Processes
+import numpy as np  # Computation
+import pandas as pd  # Data Reading
+from JayUtilities import DataIO as Jio  # Data Input/Output Processing Utility Class
+
+metadata = {
+    'Author      ': 'Jay Annadurai',
+    'Date        ': '17 Oct 2026',
+    'Project     ': 'OperonPredictor',
+    'Version     ': 1.0,
+    'Description ': "Vectorized Operon Prediction of Gene Tables for Jay Annadurai's Scripts"
+}
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+#  Operon Predictor Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class OperonPredictor:
+    # Static variable for the distance threshold of adjacent genes in the same operon
+    # Operons are considered adjacent co-directional genes with an intervening distance less than 50 bp
+    within_operon_dist = 50
+    # Operon label prefix of each strand reading direction
+    strand_prefixes = {'+': 'F', '-': 'R'}
+    # Annotation file extensions read as PTT and GFF files, optionally followed by .gz or .bz2
+    ptt_extensions = ['.ptt']
+    gff_extensions = ['.gff', '.gff3']
+    compressed_extensions = ['.gz', '.bz2']
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Intergenic Distance Methods   #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def intergenic_distances(pos_starts: np.ndarray, pos_ends: np.ndarray, strand: str) -> np.ndarray:
+        """
+        Computes the distances between adjacent genes on one strand with shifted arrays, as the original row by row
+        predictor did. The genes must already be sorted by their start position.
+
+        Note: only the '+' result is a real intergenic distance. The '-' result reproduces the legacy formula
+        (start of gene i - end of gene i + 1), which is never positive for genes sorted by start, so no threshold
+        ever separates two reverse-strand genes. It is kept only so predict_operons matches the original outputs;
+        do not use it as a distance elsewhere.
+
+        :param pos_starts: The start positions of the sorted genes.
+        :param pos_ends: The end positions of the sorted genes.
+        :param strand: The reading direction of the genes, '+' or '-'.
+        :return: An array of len(genes) - 1 values, the ith between gene i and gene i + 1.
+        """
+        pos_starts = np.asarray(pos_starts)
+        pos_ends = np.asarray(pos_ends)
+
+        if strand == '+':
+            # > > > > > > > > > > > > > > > > > > > > > > > >
+            # SP--currentgene--EP <- dist -> SP--nextgene--EP
+            return pos_starts[1:] - pos_ends[:-1]
+        elif strand == '-':
+            # < < < < < < < < < < < < < < < < < < < < < < < <
+            # SP--nextgene--EP <- dist -> SP--currentgene--EP
+            # Legacy formula of the original predictor: the genes are sorted by start, so this is never positive
+            return pos_starts[:-1] - pos_ends[1:]
+        else:
+            raise ValueError("Unrecognized strand direction")
+
+    @staticmethod
+    def gene_gaps(pos_starts: np.ndarray, pos_ends: np.ndarray) -> np.ndarray:
+        """
+        Computes the gap in bp between each pair of adjacent genes sorted by their start position.
+        The gap lies between the end of one gene and the start of the next in genome coordinates,
+        so it is the intergenic distance on either strand.
+
+        :param pos_starts: The start positions of the sorted genes.
+        :param pos_ends: The end positions of the sorted genes.
+        :return: An array of len(genes) - 1 gaps, the ith between gene i and gene i + 1. Overlapping genes are negative.
+        """
+        return np.asarray(pos_starts)[1:] - np.asarray(pos_ends)[:-1]
+
+    @staticmethod
+    def operon_numbers(
+            distances: np.ndarray,
+            within_operon_dist: int | list | np.ndarray = None,
+            group_ids: np.ndarray = None
+    ) -> np.ndarray:
+        """
+        Numbers the operons of a strand from the distances between its adjacent genes with a cumulative sum.
+        A gene joins the operon of the previous gene when their distance is within the threshold.
+        Otherwise the count only advances when the gene was not itself joined to the gene before it,
+        matching the numbering of the original row by row predictor.
+
+        :param distances: The distances between adjacent genes as from gene_gaps or intergenic_distances.
+        :param within_operon_dist: The maximum distance of adjacent genes in the same operon,
+            or a list of distances to number the operons of every threshold at once.
+        :param group_ids: Optionally, the group (e.g. contig and strand) of every sorted gene.
+            Genes of different groups are never joined and the numbering restarts at 1 for each group.
+        :return: An int array of the operon number of every gene, starting at 1.
+            For a list of thresholds, an array with a row per threshold.
+        """
+        if within_operon_dist is None:
+            within_operon_dist = OperonPredictor.within_operon_dist
+
+        # Links join a gene to the next gene, breaks separate them
+        # A list of thresholds is broadcast against the distances as a row per threshold
+        links = np.asarray(distances) <= np.asarray(within_operon_dist)[..., np.newaxis]
+
+        # Adjacent genes of different groups are always separated
+        if group_ids is not None:
+            group_ids = np.asarray(group_ids)
+            same_group = group_ids[1:] == group_ids[:-1]
+            links &= same_group
+
+        # A break only starts a new operon number when the gene before it was not linked to it
+        no_link = np.zeros(links.shape[:-1] + (1,), dtype=bool)
+        previous_links = np.concatenate((no_link, links[..., :-1]), axis=-1)
+        increments = ~links & ~previous_links
+
+        numbers = 1 + np.concatenate((no_link.astype(np.int64), np.cumsum(increments, axis=-1)), axis=-1)
+
+        # Restart the numbering of each group by subtracting the count reached at its first gene
+        gene_count = numbers.shape[-1]
+        if group_ids is not None and gene_count > 0:
+            group_starts = np.flatnonzero(np.concatenate(([True], ~same_group)))
+            group_sizes = np.diff(np.append(group_starts, gene_count))
+            numbers -= np.repeat(numbers[..., group_starts] - 1, group_sizes, axis=-1)
+
+        return numbers
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Operon Prediction Methods     #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def predict_operons(
+            df: pd.DataFrame,
+            direction_column: str = 'Strand',
+            pos_start_column: str = 'Pos_Start',
+            pos_end_column: str = 'Pos_End',
+            within_operon_dist: int = None,
+            operon_prediction_output_column: str = 'Predicted_Operon',
+            operon_label: str = 'O',
+            legacy_distances: bool = True
+    ) -> pd.DataFrame:
+        """
+        Predicts operons as runs of adjacent co-directional genes within a distance threshold.
+        Each strand is sorted by start position once and labelled in one vectorized pass.
+
+        :param df: The gene table with strand and start and end position columns.
+        :param direction_column: The column of the strand reading direction, '+' or '-'.
+        :param pos_start_column: The column of the gene start positions.
+        :param pos_end_column: The column of the gene end positions.
+        :param within_operon_dist: The maximum distance of adjacent genes in the same operon.
+        :param operon_prediction_output_column: The column to write the predicted operon labels to.
+        :param operon_label: The prefix of the operon labels, followed by the strand prefix and the operon number.
+        :param legacy_distances: If True, reproduces the original predictor, whose reverse-strand distances never
+            split an operon (see intergenic_distances). If False, uses the gene_gaps on both strands.
+        :return: The genes on either strand with the predicted operon column, in the order of the original index.
+        """
+        strand_dfs = []
+
+        # Each directional subset contains genes read in the same direction, satisfying the codirectional requirement
+        for strand, strand_prefix in OperonPredictor.strand_prefixes.items():
+            directional_df = df[df[direction_column] == strand]
+
+            # Error Handler for any Empty Directional DFs
+            if directional_df.empty:
+                strand_dfs.append(directional_df)
+                continue
+
+            # Sort by start position to ensure sequential processing
+            directional_df = directional_df.sort_values(by=pos_start_column)
+
+            # Distances between adjacent genes and the operon number of each gene
+            pos_starts = directional_df[pos_start_column].to_numpy()
+            pos_ends = directional_df[pos_end_column].to_numpy()
+            if legacy_distances:
+                distances = OperonPredictor.intergenic_distances(pos_starts, pos_ends, strand)
+            else:
+                distances = OperonPredictor.gene_gaps(pos_starts, pos_ends)
+            numbers = OperonPredictor.operon_numbers(distances, within_operon_dist)
+
+            # Label each gene by the prefixes and its operon number
+            labels = pd.Series(
+                np.char.add(f"{operon_label}{strand_prefix}", numbers.astype(str)),
+                index=directional_df.index,
+                dtype=object
+            )
+            strand_dfs.append(directional_df.assign(**{operon_prediction_output_column: labels}))
+
+        # Combine the results from both strands and sort by the original index to maintain the gene order
+        return pd.concat(strand_dfs).sort_index()
+
+    @staticmethod
+    def sort_genes(
+            df: pd.DataFrame,
+            contig_column: str = None,
+            direction_column: str = 'Strand',
+            pos_start_column: str = 'Pos_Start',
+            pos_end_column: str = 'Pos_End',
+            operon_label: str = 'O',
+            legacy_distances: bool = False
+    ) -> dict:
+        """
+        Sorts the genes on either strand once by contig, strand and start position and computes the distance
+        between every pair of adjacent genes, for labelling the operons of one or many thresholds.
+
+        :param df: The gene table with strand and start and end position columns.
+        :param contig_column: The column of the contig of each gene. None treats every gene as one sequence.
+        :param direction_column: The column of the strand reading direction, '+' or '-'.
+        :param pos_start_column: The column of the gene start positions.
+        :param pos_end_column: The column of the gene end positions.
+        :param operon_label: The prefix of the operon labels without a contig column.
+            With a contig column the prefix is '{contig}-'.
+        :param legacy_distances: If True, computes the reverse-strand distances with the legacy formula of
+            intergenic_distances. If False, uses the gene_gaps on both strands.
+        :return: A dictionary of the 'df' of genes on either strand, the sorting 'order' of its rows,
+            the sorted 'distances' and 'group_ids' of the (contig, strand) groups, the sorted label 'prefixes'
+            and the 'contig_codes' of the rows numbered by first appearance.
+        """
+        # Only genes on either strand are predicted
+        df = df[df[direction_column].isin(list(OperonPredictor.strand_prefixes))]
+
+        # Number the contigs by first appearance and the strands by their prefix order
+        if contig_column is not None:
+            contig_codes, contigs = pd.factorize(df[contig_column])
+            contig_prefixes = np.char.add(np.asarray(contigs.astype(str)).astype(str), '-')
+        else:
+            contig_codes = np.zeros(len(df), dtype=np.int64)
+            contig_prefixes = np.array([operon_label])
+        strands = df[direction_column].to_numpy()
+        strand_codes = (strands == '-').astype(np.int64)
+        pos_starts = df[pos_start_column].to_numpy()
+        pos_ends = df[pos_end_column].to_numpy()
+
+        # Sort once by contig, strand and start position
+        order = np.lexsort((pos_starts, strand_codes, contig_codes))
+        sorted_strands = strands[order]
+        sorted_starts = pos_starts[order]
+        sorted_ends = pos_ends[order]
+
+        # Distances between adjacent genes, the pairs across a contig or strand boundary are separated later
+        if legacy_distances:
+            distances = np.where(
+                sorted_strands[:-1] == '+',
+                OperonPredictor.intergenic_distances(sorted_starts, sorted_ends, '+'),
+                OperonPredictor.intergenic_distances(sorted_starts, sorted_ends, '-')
+            )
+        else:
+            distances = OperonPredictor.gene_gaps(sorted_starts, sorted_ends)
+
+        # Label prefix of each sorted gene from its contig and strand
+        prefixes = np.char.add(
+            contig_prefixes[contig_codes[order]],
+            np.where(
+                sorted_strands == '+',
+                OperonPredictor.strand_prefixes['+'],
+                OperonPredictor.strand_prefixes['-']
+            )
+        )
+
+        return {
+            'df': df,
+            'order': order,
+            'distances': distances,
+            'group_ids': contig_codes[order] * 2 + strand_codes[order],
+            'prefixes': prefixes,
+            'contig_codes': contig_codes
+        }
+
+    @staticmethod
+    def predict_operons_contig_based(
+            df: pd.DataFrame,
+            contig_column: str = 'Contig',
+            direction_column: str = 'Strand',
+            pos_start_column: str = 'Pos_Start',
+            pos_end_column: str = 'Pos_End',
+            within_operon_dist: int = None,
+            operon_prediction_output_column: str = 'Predicted_Operon',
+            legacy_distances: bool = True
+    ) -> pd.DataFrame:
+        """
+        Predicts operons separately within every contig, as for metagenome assemblies.
+        All contigs are labelled in one pass: the genes are sorted once by contig, strand and start position
+        and the operon numbering restarts at every contig and strand.
+        Operons are labelled '{contig}-F{n}' and '{contig}-R{n}', as predict_operons with a contig prefix would.
+
+        :param df: The gene table with contig, strand and start and end position columns.
+        :param contig_column: The column of the contig of each gene.
+        :param direction_column: The column of the strand reading direction, '+' or '-'.
+        :param pos_start_column: The column of the gene start positions.
+        :param pos_end_column: The column of the gene end positions.
+        :param within_operon_dist: The maximum distance of adjacent genes in the same operon.
+        :param operon_prediction_output_column: The column to write the predicted operon labels to.
+        :param legacy_distances: If True, reproduces the original predictor, whose reverse-strand distances never
+            split an operon (see intergenic_distances). If False, uses the gene_gaps on both strands.
+        :return: The genes on either strand with the predicted operon column and a new range index,
+            grouped by contig in order of first appearance and sorted by the original index within each contig.
+        """
+        sorted_genes = OperonPredictor.sort_genes(
+            df, contig_column, direction_column, pos_start_column, pos_end_column, legacy_distances=legacy_distances
+        )
+        df = sorted_genes['df']
+        order = sorted_genes['order']
+
+        # Number the operons with the numbering restarting for each contig and strand
+        numbers = OperonPredictor.operon_numbers(
+            sorted_genes['distances'], within_operon_dist, group_ids=sorted_genes['group_ids']
+        )
+
+        # Label each gene by its contig, strand prefix and operon number
+        labels = np.empty(len(df), dtype=object)
+        labels[order] = np.char.add(sorted_genes['prefixes'], numbers.astype(str))
+
+        # Group the genes by contig in order of first appearance, keeping the original index order within each contig
+        index_ranks = np.empty(len(df), dtype=np.int64)
+        index_ranks[df.index.sort_values(return_indexer=True)[1]] = np.arange(len(df))
+        output_order = np.lexsort((index_ranks, sorted_genes['contig_codes']))
+
+        operon_df = df.assign(**{operon_prediction_output_column: pd.Series(labels, index=df.index, dtype=object)})
+        return operon_df.iloc[output_order].reset_index(drop=True)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Threshold Sweep Methods       #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def sweep_thresholds(
+            df: pd.DataFrame,
+            thresholds: list | np.ndarray,
+            contig_column: str = None,
+            direction_column: str = 'Strand',
+            pos_start_column: str = 'Pos_Start',
+            pos_end_column: str = 'Pos_End',
+            operon_label: str = 'O',
+            include_labels: bool = True,
+            legacy_distances: bool = False
+    ) -> dict:
+        """
+        Predicts the operons of many distance thresholds at once for calibrating the threshold of an organism.
+        The genes are sorted and their distances computed once, then every threshold is numbered in one
+        broadcast pass. The labels of each threshold match predict_operons (or predict_operons_contig_based
+        with a contig column) at that threshold with the same legacy_distances.
+
+        :param df: The gene table with strand and start and end position columns.
+        :param thresholds: The maximum distances of adjacent genes in the same operon to sweep.
+        :param contig_column: The column of the contig of each gene, to predict per contig as for GFF files.
+        :param direction_column: The column of the strand reading direction, '+' or '-'.
+        :param pos_start_column: The column of the gene start positions.
+        :param pos_end_column: The column of the gene end positions.
+        :param operon_label: The prefix of the operon labels without a contig column.
+        :param include_labels: If True, also returns the label of every gene at every threshold.
+        :param legacy_distances: If True, uses the legacy reverse-strand formula of intergenic_distances,
+            under which no threshold splits the reverse strand. Defaults to the gene_gaps on both strands.
+        :return: A dictionary of DataFrames:
+            'summary': per threshold, the operon count, the multi-gene operon count, the genes in multi-gene operons
+                and the mean and max operon size.
+            'sizes': the count of operons of each size per threshold.
+            'labels': the operon label of every gene (rows, in the original order) for every threshold (columns).
+        """
+        thresholds = np.atleast_1d(np.asarray(thresholds))
+
+        # Sort and measure the distances once for every threshold
+        sorted_genes = OperonPredictor.sort_genes(
+            df, contig_column, direction_column, pos_start_column, pos_end_column, operon_label, legacy_distances
+        )
+        gene_count = len(sorted_genes['df'])
+
+        # Operon numbers with a row per threshold
+        numbers = OperonPredictor.operon_numbers(
+            sorted_genes['distances'], thresholds, group_ids=sorted_genes['group_ids']
+        )
+
+        # An operon starts at each group start or distance break, with a row per threshold
+        # The numbers are not used here: a number can be reused right after a multi-gene operon
+        group_starts = np.concatenate(([True], sorted_genes['group_ids'][1:] != sorted_genes['group_ids'][:-1]))
+        links = sorted_genes['distances'] <= thresholds[:, np.newaxis]
+        operon_starts = group_starts | np.concatenate(
+            (np.ones((len(thresholds), 1), dtype=bool), ~links), axis=1
+        )
+
+        # Size of every operon from the distance between consecutive operon starts, over all thresholds at once
+        flat_starts = np.flatnonzero(operon_starts)
+        operon_sizes = np.diff(np.append(flat_starts, operon_starts.size))
+        operon_thresholds = flat_starts // max(gene_count, 1)
+
+        # Count the operons of each size per threshold
+        size_counts = pd.DataFrame({'Threshold': thresholds[operon_thresholds], 'Operon_Size': operon_sizes})
+        sizes_df = size_counts.groupby(['Threshold', 'Operon_Size'], sort=True).size().rename('Count').reset_index()
+
+        # Summary of the operons of each threshold
+        operon_counts = np.bincount(operon_thresholds, minlength=len(thresholds))
+        max_sizes = np.zeros(len(thresholds), dtype=np.int64)
+        np.maximum.at(max_sizes, operon_thresholds, operon_sizes)
+        multi_gene = operon_sizes > 1
+        summary_df = pd.DataFrame({
+            'Threshold': thresholds,
+            'Operons': operon_counts,
+            'Multi_Gene_Operons': np.bincount(operon_thresholds[multi_gene], minlength=len(thresholds)),
+            'Genes_In_Multi_Gene_Operons': np.bincount(
+                operon_thresholds[multi_gene], weights=operon_sizes[multi_gene], minlength=len(thresholds)
+            ).astype(np.int64),
+            'Mean_Operon_Size': gene_count / np.maximum(operon_counts, 1),
+            'Max_Operon_Size': max_sizes
+        })
+
+        sweep = {'summary': summary_df, 'sizes': sizes_df}
+
+        # Labels of every gene in the original order, a column per threshold
+        if include_labels:
+            labels = np.empty((len(thresholds), gene_count), dtype=object)
+            labels[:, sorted_genes['order']] = np.char.add(sorted_genes['prefixes'], numbers.astype(str))
+            sweep['labels'] = pd.DataFrame(labels.T, index=sorted_genes['df'].index, columns=thresholds)
+
+        return sweep
+
+    @staticmethod
+    def operon_count(
+            df: pd.DataFrame,
+            contig_column: str = None,
+            within_operon_dist: int = None,
+            legacy_distances: bool = False,
+            **column_args
+    ) -> int:
+        """
+        Counts the operons predicted at one threshold from the distance breaks between adjacent genes.
+        Labels cannot be counted instead, as the numbering reuses a number right after a multi-gene operon.
+
+        :param df: The gene table with strand and start and end position columns.
+        :param contig_column: The column of the contig of each gene, to predict per contig as for GFF files.
+        :param within_operon_dist: The maximum distance of adjacent genes in the same operon.
+        :param legacy_distances: If True, uses the legacy reverse-strand formula of intergenic_distances.
+            Defaults to the gene_gaps on both strands.
+        :param column_args: Optionally, the direction_column, pos_start_column and pos_end_column of the genes.
+        :return: The number of predicted operons.
+        """
+        if within_operon_dist is None:
+            within_operon_dist = OperonPredictor.within_operon_dist
+
+        sweep = OperonPredictor.sweep_thresholds(
+            df, [within_operon_dist], contig_column=contig_column, include_labels=False,
+            legacy_distances=legacy_distances, **column_args
+        )
+        return int(sweep['summary']['Operons'].iloc[0])
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Batch Prediction Methods      #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def annotation_format(file_path: str) -> tuple:
+        """
+        Identifies an annotation file as PTT or GFF from its extension, ignoring any compression extension.
+
+        :param file_path: The path of the annotation file.
+        :return: A tuple of the genome name (the file name without extensions) and the format 'ptt' or 'gff',
+            or None as the format for any other file.
+        """
+        genome_name, extension = os.path.splitext(os.path.basename(file_path))
+        if extension.lower() in OperonPredictor.compressed_extensions:
+            genome_name, extension = os.path.splitext(genome_name)
+
+        extension = extension.lower()
+        if extension in OperonPredictor.ptt_extensions:
+            return genome_name, 'ptt'
+        elif extension in OperonPredictor.gff_extensions:
+            return genome_name, 'gff'
+        else:
+            return genome_name, None
+
+    @staticmethod
+    def genome_files(source: str | list) -> list:
+        """
+        Lists the annotation files of a batch from a directory, a manifest file or a list of paths.
+
+        :param source: A directory of PTT/GFF files, a manifest file with one path per line
+            (relative paths are resolved from the manifest folder, lines starting with '#' are skipped),
+            or a list of file paths.
+        :return: A list of the annotation file paths.
+        """
+        if isinstance(source, (list, tuple)):
+            return list(source)
+
+        if os.path.isdir(source):
+            file_names = sorted(os.listdir(source))
+            return [
+                os.path.join(source, file_name) for file_name in file_names
+                if OperonPredictor.annotation_format(file_name)[1] is not None
+            ]
+
+        # Manifest of one annotation file per line
+        manifest_folder = os.path.dirname(source)
+        with open(source) as manifest:
+            lines = [line.strip() for line in manifest]
+
+        return [os.path.join(manifest_folder, line) for line in lines if line and not line.startswith('#')]
+
+    @staticmethod
+    def predict_genome_file(
+            file_path: str,
+            output_folder: str,
+            output_format: str = 'tsv',
+            within_operon_dist: int = None,
+            legacy_distances: bool = False
+    ) -> dict:
+        """
+        Runs parse -> predict -> write for one genome annotation file.
+        PTT files are predicted with predict_operons and GFF files per contig with predict_operons_contig_based.
+        The predicted operons are saved as 'PredictedOperons_{genome}' in the output folder.
+
+        :param file_path: The path of the PTT or GFF annotation file.
+        :param output_folder: The folder to save the predicted operons in.
+        :param output_format: The format of the file to save the predicted operons as.
+        :param within_operon_dist: The maximum distance of adjacent genes in the same operon.
+        :param legacy_distances: If True, reproduces the original predictor, whose reverse-strand distances never
+            split an operon (see intergenic_distances). Defaults to the gene_gaps on both strands.
+        :return: A dictionary of the genome, its gene and operon counts, the seconds of each step and the output file.
+        """
+        genome_name, annotation_format = OperonPredictor.annotation_format(file_path)
+        if annotation_format is None:
+            raise ValueError(f"Unsupported annotation file {file_path}, try: ['.ptt', '.gff', '.gff3']")
+
+        # The folders are passed explicitly, leaving the DataIO folders of the caller untouched
+        input_folder, file_name = os.path.split(file_path)
+
+        # Parse
+        read_start = time.perf_counter()
+        if annotation_format == 'ptt':
+            genome_df = Jio.read_ptt(file_name, folder=input_folder)
+        else:
+            genome_df = Jio.read_gff(file_name, folder=input_folder)
+        read_end = time.perf_counter()
+
+        # Predict
+        if annotation_format == 'ptt':
+            operon_df = OperonPredictor.predict_operons(
+                genome_df, within_operon_dist=within_operon_dist, legacy_distances=legacy_distances
+            )
+        else:
+            operon_df = OperonPredictor.predict_operons_contig_based(
+                genome_df, within_operon_dist=within_operon_dist, legacy_distances=legacy_distances
+            )
+
+        # Count the operons from the distance breaks, as a label can be reused right after a multi-gene operon
+        operon_count = OperonPredictor.operon_count(
+            genome_df,
+            contig_column=None if annotation_format == 'ptt' else 'Contig',
+            within_operon_dist=within_operon_dist,
+            legacy_distances=legacy_distances
+        )
+        predict_end = time.perf_counter()
+
+        # Write
+        output_file = f"PredictedOperons_{genome_name}"
+        Jio.df_to_file(df=operon_df, file_name=output_file, file_format=output_format, folder=output_folder)
+        write_end = time.perf_counter()
+
+        return {
+            'Genome': genome_name,
+            'Format': annotation_format,
+            'Genes': len(operon_df),
+            'Operons': operon_count,
+            'Read_Seconds': read_end - read_start,
+            'Predict_Seconds': predict_end - read_end,
+            'Write_Seconds': write_end - predict_end,
+            'Total_Seconds': write_end - read_start,
+            'Output_File': os.path.join(output_folder, f"{output_file}.{output_format}")
+        }
+
+    @staticmethod
+    def predict_genomes(
+            source: str | list,
+            output_folder: str,
+            max_workers: int = None,
+            output_format: str = 'tsv',
+            within_operon_dist: int = None,
+            legacy_distances: bool = False
+    ) -> pd.DataFrame:
+        """
+        Predicts the operons of a batch of genomes across a process pool.
+        Each worker parses, predicts and writes one genome at a time, so every output reaches the disk
+        as soon as its genome finishes. A genome that fails is reported with its error rather than stopping the batch.
+
+        :param source: A directory of PTT/GFF files, a manifest file or a list of paths, as for genome_files.
+        :param output_folder: The folder to save the predicted operons in. Created if missing.
+        :param max_workers: The number of worker processes. Defaults to the CPU count.
+        :param output_format: The format of the files to save the predicted operons as.
+        :param within_operon_dist: The maximum distance of adjacent genes in the same operon.
+        :param legacy_distances: If True, reproduces the legacy reverse-strand distances of the original predictor.
+            Defaults to the gene_gaps on both strands.
+        :return: A DataFrame of the per-genome timings as returned by predict_genome_file, with an 'Error' column,
+            in order of completion.
+        """
+        file_paths = OperonPredictor.genome_files(source)
+        os.makedirs(output_folder, exist_ok=True)
+
+        genome_results = []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    OperonPredictor.predict_genome_file,
+                    file_path, output_folder, output_format, within_operon_dist, legacy_distances
+                ): file_path
+                for file_path in file_paths
+            }
+
+            # Collect each genome as it finishes
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    genome_result = future.result()
+                    genome_result['Error'] = None
+                except Exception as e:
+                    genome_result = {'Genome': OperonPredictor.annotation_format(file_path)[0], 'Error': repr(e)}
+
+                genome_result['File'] = file_path
+                genome_results.append(genome_result)
+
+        return pd.DataFrame(genome_results, columns=[
+            'Genome', 'Format', 'Genes', 'Operons', 'Read_Seconds', 'Predict_Seconds', 'Write_Seconds',
+            'Total_Seconds', 'Output_File', 'File', 'Error'
+        ]).astype({'Genes': 'Int64', 'Operons': 'Int64'})
@@ -0,0 +1,87 @@
+# Import Libraries
+import pandas as pd  # Data Reading
+from OperonPredictor import OperonPredictor  # Vectorized Operon Prediction Class
+
+
+def test_sweep_thresholds_counts_adjacent_operons_separately():
+    # Two 2-gene operons separated by a 700 bp gap on the + strand
+    # The numbering of the original predictor reuses the same number for both, which must not merge them
+    df = pd.DataFrame({
+        'Strand': ['+', '+', '+', '+'],
+        'Pos_Start': [1, 120, 1000, 1120],
+        'Pos_End': [100, 300, 1100, 1300]
+    })
+
+    sweep = OperonPredictor.sweep_thresholds(df, [50])
+    summary = sweep['summary'].iloc[0]
+
+    assert summary['Operons'] == 2
+    assert summary['Multi_Gene_Operons'] == 2
+    assert summary['Max_Operon_Size'] == 2
+    assert sweep['sizes']['Operon_Size'].tolist() == [2]
+    assert sweep['sizes']['Count'].tolist() == [2]
+
+
+def test_sweep_thresholds_splits_reverse_strand_gaps():
+    # Two 2-gene operons on the - strand separated by a 700 bp gap, and a 60 bp gap within the second pair
+    df = pd.DataFrame({
+        'Strand': ['-', '-', '-', '-'],
+        'Pos_Start': [1, 120, 1000, 1160],
+        'Pos_End': [100, 300, 1100, 1300]
+    })
+
+    summary = OperonPredictor.sweep_thresholds(df, [50, 100, 1000])['summary']
+
+    assert summary['Operons'].tolist() == [3, 2, 1]
+    assert summary['Max_Operon_Size'].tolist() == [2, 2, 4]
+
+    # The sweep labels match the predictor using the same gaps
+    sweep_labels = OperonPredictor.sweep_thresholds(df, [50])['labels'][50]
+    predicted = OperonPredictor.predict_operons(df, within_operon_dist=50, legacy_distances=False)
+    assert (sweep_labels == predicted['Predicted_Operon']).all()
+
+
+def write_ptt(path, genes):
+    # Writes a minimal PTT file of (start, end, strand) genes
+    lines = [
+        'Test genome - 1..10000',
+        f'{len(genes)} proteins',
+        'Location\tStrand\tLength\tPID\tGene\tSynonym\tCode\tCOG\tProduct'
+    ]
+    for number, (start, end, strand) in enumerate(genes):
+        lines.append(f'{start}..{end}\t{strand}\t{(end - start) // 3}\t{number}\tg{number}\tb{number}\t-\t-\tprotein')
+    path.write_text('\n'.join(lines) + '\n')
+
+
+def test_predict_genomes_counts_operons_on_both_strands(tmp_path):
+    input_folder = tmp_path / 'Input'
+    input_folder.mkdir()
+
+    # Forward: 2 operons. Reverse: 2 operons split by a 700 bp gap
+    write_ptt(input_folder / 'GenomeA.ptt', [
+        (1, 100, '+'), (120, 300, '+'), (1000, 1100, '+'),
+        (2000, 2100, '-'), (2120, 2300, '-'), (3000, 3100, '-'), (3120, 3200, '-')
+    ])
+    # Forward: 1 operon. Reverse: 3 single-gene operons
+    write_ptt(input_folder / 'GenomeB.ptt', [
+        (1, 100, '-'), (500, 600, '-'), (1000, 1100, '-'), (5000, 5100, '+'), (5110, 5200, '+')
+    ])
+    # Contig c1 reverse: 2 operons. Contig c2 forward: 2 operons
+    (input_folder / 'GenomeC.gff').write_text('\n'.join([
+        '##gff-version 3',
+        'c1\tsrc\tCDS\t1\t100\t.\t-\t0\tID=1;locus_tag=t1',
+        'c1\tsrc\tCDS\t110\t200\t.\t-\t0\tID=2;locus_tag=t2',
+        'c1\tsrc\tCDS\t900\t1000\t.\t-\t0\tID=3;locus_tag=t3',
+        'c2\tsrc\tCDS\t1\t100\t.\t+\t0\tID=4;locus_tag=t4',
+        'c2\tsrc\tCDS\t500\t600\t.\t+\t0\tID=5;locus_tag=t5'
+    ]) + '\n')
+
+    timings_df = OperonPredictor.predict_genomes(str(input_folder), str(tmp_path / 'Output'), max_workers=2)
+    operon_counts = timings_df.set_index('Genome')['Operons'].to_dict()
+
+    assert timings_df['Error'].isna().all()
+    assert operon_counts == {'GenomeA': 4, 'GenomeB': 4, 'GenomeC': 4}
+
+    # The reverse-strand genes of B are written as separate operons
+    genome_b_df = pd.read_csv(tmp_path / 'Output' / 'PredictedOperons_GenomeB.tsv', sep='\t')
+    assert genome_b_df.loc[genome_b_df['Strand'] == '-', 'Predicted_Operon'].nunique() == 3
@@ -8,9 +8,9 @@ import pandas as pd  # Data Reading
 
 metadata = {
     'Author      ': 'Jay Annadurai',
-    'Date        ': '12 Apr 2024',
+    'Date        ': '17 Oct 2026',
     'Project     ': 'JayUtilities',
-    'Version     ': 1.2,
+    'Version     ': 1.3,
     'Description ': "Contains Utility Functions as used by Jay Annadurai's Scripts"
 }
 
@@ -252,6 +252,138 @@ class DataIO:
             # Print the status of the compressed file
             print(f'Compressed {file_name} to {output_path}')
 
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  File -> Sequence Record Methods       #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def read_sequence_records(file_name: str, record_format: str = 'auto'):
+        """
+        Streams the nucleotide sequence records of a file from the input folder without building a DataFrame.
+        Supports FASTA files and region files with one 'ID \\ SEQUENCE \\' record per line
+        (such as the 400 upstream / 50 downstream gene region files). Gzip and BZip files are read directly.
+
+        :param file_name: The name of the file to read from the input folder.
+        :param record_format: The format of the records ('fasta', 'region' or 'auto' to detect from the first line).
+        :return: A generator of (sequence_id, sequence) tuples, with the sequence as bytes without whitespace.
+        """
+        file_path = os.path.join(DataIO.input_folder, file_name)
+
+        # Determine the appropriate decompression method based on the file extension
+        if file_name.endswith('.gz'):
+            open_func = gzip.open
+        elif file_name.endswith('.bz2'):
+            open_func = bz2.open
+        else:
+            open_func = open
+
+        with open_func(file_path, 'rb') as input_file:
+            # Skip any leading empty lines and detect the record format from the first line
+            line = input_file.readline()
+            while line and not line.strip():
+                line = input_file.readline()
+
+            if record_format == 'auto':
+                record_format = 'fasta' if line.startswith(b'>') else 'region'
+
+            if record_format == 'region':
+                while line:
+                    # Each line is 'ID \ SEQUENCE \'
+                    sequence_id, _, sequence = line.rstrip().rstrip(b'\\').partition(b'\\')
+                    if sequence_id.strip():
+                        yield sequence_id.strip().decode(), sequence.strip()
+                    line = input_file.readline()
+
+            elif record_format == 'fasta':
+                sequence_id, sequence_lines = None, []
+                while line:
+                    if line.startswith(b'>'):
+                        # Yield the previous record once the next header is reached
+                        if sequence_id is not None:
+                            yield sequence_id, b''.join(sequence_lines)
+                        header = line[1:].split()
+                        sequence_id, sequence_lines = (header[0].decode() if header else ''), []
+                    else:
+                        # Remove any whitespace within the sequence lines
+                        sequence_lines.append(b''.join(line.split()))
+                    line = input_file.readline()
+
+                # Yield the final record
+                if sequence_id is not None:
+                    yield sequence_id, b''.join(sequence_lines)
+
+            else:
+                raise ValueError(f"Unsupported record format {record_format}, try: ['fasta', 'region', 'auto']")
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Encoded Sequence Store Methods        #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def save_encoded_sequences(encoded: dict, store_name: str, folder: str = None) -> None:
+        """
+        Saves encoded sequences (as from PSWMScanner.encode_sequences) as a compact on-disk store.
+        The store is a raw file of uint8 base codes ('{store_name}.codes') and an index of the sequence IDs,
+        their offsets into the codes and their lengths ('{store_name}.index.npz').
+
+        :param encoded: A dictionary with the 'ids', 'codes', 'starts', 'lengths' and 'alphabet' of the sequences.
+        :param store_name: The name of the store without the extension.
+        :param folder: The folder to save the store in. Defaults to the output folder.
+        :return: None
+        """
+        if folder is None:
+            folder = DataIO.output_folder
+
+        store_path = os.path.join(folder, store_name)
+
+        # Write the codes as raw bytes so they can be memory-mapped as is
+        np.ascontiguousarray(encoded['codes'], dtype=np.uint8).tofile(f"{store_path}.codes")
+
+        # Write the index of the sequences within the codes
+        np.savez(
+            f"{store_path}.index.npz",
+            ids=np.asarray(encoded['ids']).astype(str),
+            starts=np.asarray(encoded['starts'], dtype=np.int64),
+            lengths=np.asarray(encoded['lengths'], dtype=np.int64),
+            alphabet=np.array(encoded['alphabet'])
+        )
+
+    @staticmethod
+    def load_encoded_sequences(store_name: str, folder: str = None) -> dict:
+        """
+        Opens an encoded sequence store saved by save_encoded_sequences.
+        The codes are memory-mapped read-only, so opening is near instant regardless of the store size
+        and the pages of the codes are shared by every process reading the same store.
+
+        :param store_name: The name of the store without the extension.
+        :param folder: The folder to load the store from. Defaults to the output folder, as for saving.
+        :return: A dictionary with the 'ids', 'codes', 'starts', 'lengths' and 'alphabet' of the sequences.
+        """
+        if folder is None:
+            folder = DataIO.output_folder
+
+        store_path = os.path.join(folder, store_name)
+
+        with np.load(f"{store_path}.index.npz") as index:
+            ids = index['ids'].astype(object)
+            starts = index['starts']
+            lengths = index['lengths']
+            alphabet = str(index['alphabet'])
+
+        # Memory-map the codes; np.memmap cannot map an empty file
+        if os.path.getsize(f"{store_path}.codes") > 0:
+            codes = np.memmap(f"{store_path}.codes", dtype=np.uint8, mode='r')
+        else:
+            codes = np.zeros(0, dtype=np.uint8)
+
+        return {
+            'ids': ids,
+            'codes': codes,
+            'starts': starts,
+            'lengths': lengths,
+            'alphabet': alphabet
+        }
+
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
     #  Dataframe Manipulation Methods  #
     # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
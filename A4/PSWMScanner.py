@@ -0,0 +1,1261 @@
+# Import Libraries
+import heapq  # Bounded Heap of Top Hits
+import os  # CPU Count
+from concurrent.futures import ProcessPoolExecutor  # Parallel Scanning across Processes
+from multiprocessing import shared_memory  # Zero-Copy Sequence Buffer shared with Worker Processes
+import numpy as np  # Computation
+import pandas as pd  # Data Reading
+from JayUtilities import DataIO as Jio  # Data Input/Output Processing Utility Class
+
+metadata = {
+    'Author      ': 'Jay Annadurai',
+    'Date        ': '17 Oct 2026',
+    'Project     ': 'PSWMScanner',
+    'Version     ': 1.0,
+    'Description ': "Vectorized PSWM Scanning of Encoded Nucleotide Sequences for Jay Annadurai's Scripts"
+}
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+#  PSWM Sequence Scanner Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class PSWMScanner:
+    # Static variable for the nucleotide alphabet and its integer code order
+    # Any character outside the alphabet is encoded as len(alphabet)
+    alphabet = 'acgt'
+    # Complement of each base, used to reverse complement a PSWM for the reverse strand
+    complements = {'a': 't', 'c': 'g', 'g': 'c', 't': 'a'}
+    # Labels of the forward and reverse strands by their index in a both-strand score matrix
+    strand_labels = np.array(['+', '-'])
+    # Number of sequences scored per batch to bound the memory of intermediate arrays
+    batch_size = 4096
+    # Width of the score bins of the exact score distributions
+    score_resolution = 0.001
+    # Cache of the score distributions per PSWM, background and resolution
+    _score_distributions = {}
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Sequence Encoding Methods     #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def encoding_table(alphabet: str = None) -> np.ndarray:
+        """
+        Builds a 256 entry lookup table mapping byte values to the integer codes of the alphabet.
+        Both upper and lower case characters map to the same code, unrecognized characters map to len(alphabet).
+
+        :param alphabet: The ordered alphabet of the codes. Defaults to PSWMScanner.alphabet.
+        :return: A uint8 Numpy array of length 256.
+        """
+        if alphabet is None:
+            alphabet = PSWMScanner.alphabet
+
+        # Every byte defaults to the unknown code
+        table = np.full(256, len(alphabet), dtype=np.uint8)
+
+        # Assign each character in the alphabet its position as the code
+        for code, char in enumerate(alphabet):
+            table[ord(char.lower())] = code
+            table[ord(char.upper())] = code
+
+        return table
+
+    @staticmethod
+    def encode_sequences(
+            sequences: pd.Series | list,
+            sequence_ids: pd.Series | list = None,
+            alphabet: str = None
+    ) -> dict:
+        """
+        Encodes a collection of nucleotide sequences once into a single flat uint8 array of integer codes.
+        Each sequence is located in the flat array by its start offset and its length.
+
+        :param sequences: The sequences to encode as strings or bytes.
+        :param sequence_ids: The identifiers of the sequences. Defaults to the Series index or the list position.
+        :param alphabet: The ordered alphabet of the codes. Defaults to PSWMScanner.alphabet.
+        :return: A dictionary with the 'ids', 'codes', 'starts', 'lengths' and 'alphabet' of the encoded sequences.
+        """
+        if alphabet is None:
+            alphabet = PSWMScanner.alphabet
+
+        # Default the identifiers to the index of a Series or the position within a list
+        if sequence_ids is None:
+            sequence_ids = sequences.index if isinstance(sequences, pd.Series) else range(len(sequences))
+
+        sequences = list(sequences)
+        ids = np.asarray(list(sequence_ids), dtype=object)
+
+        if len(ids) != len(sequences):
+            raise ValueError(f"Number of sequence IDs {len(ids)} does not match number of sequences {len(sequences)}")
+
+        # Join all sequences into a single byte buffer so the encoding is a single lookup
+        if sequences and isinstance(sequences[0], (bytes, bytearray)):
+            raw_bytes = b''.join(sequences)
+        else:
+            raw_bytes = ''.join(sequences).encode('ascii')
+
+        # Translate the raw bytes into integer codes with the lookup table
+        codes = PSWMScanner.encoding_table(alphabet)[np.frombuffer(raw_bytes, dtype=np.uint8)]
+
+        # Locate each sequence within the flat array of codes
+        lengths = np.fromiter((len(sequence) for sequence in sequences), dtype=np.int64, count=len(sequences))
+        starts = np.zeros(len(sequences), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+
+        return {
+            'ids': ids,
+            'codes': codes,
+            'starts': starts,
+            'lengths': lengths,
+            'alphabet': alphabet
+        }
+
+    @staticmethod
+    def encode_records(records, alphabet: str = None) -> dict:
+        """
+        Encodes a stream of (sequence_id, sequence) records, such as from DataIO.read_sequence_records,
+        translating each record straight into a growing buffer of integer codes.
+        No per-record strings or DataFrame rows are kept beyond the record being read.
+
+        :param records: An iterable of (sequence_id, sequence) records with the sequence as bytes or a string.
+        :param alphabet: The ordered alphabet of the codes. Defaults to PSWMScanner.alphabet.
+        :return: A dictionary of encoded sequences as returned by encode_sequences.
+        """
+        if alphabet is None:
+            alphabet = PSWMScanner.alphabet
+
+        # Byte translation table from characters to codes
+        translation_table = PSWMScanner.encoding_table(alphabet).tobytes()
+
+        ids, lengths = [], []
+        codes_buffer = bytearray()
+        for sequence_id, sequence in records:
+            if isinstance(sequence, str):
+                sequence = sequence.encode('ascii')
+            ids.append(sequence_id)
+            lengths.append(len(sequence))
+            codes_buffer += sequence.translate(translation_table)
+
+        lengths = np.array(lengths, dtype=np.int64)
+        starts = np.zeros(len(lengths), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+
+        return {
+            'ids': np.asarray(ids, dtype=object),
+            'codes': np.frombuffer(codes_buffer, dtype=np.uint8),
+            'starts': starts,
+            'lengths': lengths,
+            'alphabet': alphabet
+        }
+
+    @staticmethod
+    def slice_encoded(encoded: dict, start: int = None, stop: int = None) -> dict:
+        """
+        Slices every encoded sequence to [start:stop] by adjusting its offsets, without copying the codes.
+        Follows Python slicing rules, so negative positions count back from the end of each sequence.
+        For example, slice_encoded(encoded, 0, 400) selects the upstream regions of 400_50 gene regions.
+
+        :param encoded: The dictionary of encoded sequences from encode_sequences.
+        :param start: The start position within each sequence.
+        :param stop: The stop position within each sequence.
+        :return: A dictionary of the sliced encoded sequences sharing the codes of the original.
+        """
+        lengths = encoded['lengths']
+
+        # Resolve the slice positions per sequence like Python slicing
+        def resolve_position(position, default):
+            if position is None:
+                return default
+            return np.clip(np.where(position < 0, lengths + position, position), 0, lengths)
+
+        slice_starts = resolve_position(start, np.zeros_like(lengths))
+        slice_stops = resolve_position(stop, lengths)
+
+        return {
+            'ids': encoded['ids'],
+            'codes': encoded['codes'],
+            'starts': encoded['starts'] + slice_starts,
+            'lengths': np.maximum(slice_stops - slice_starts, 0),
+            'alphabet': encoded['alphabet']
+        }
+
+    @staticmethod
+    def subset_encoded(encoded: dict, selection: slice | np.ndarray) -> dict:
+        """
+        Selects a subset of the encoded sequences without copying the flat array of codes.
+
+        :param encoded: The dictionary of encoded sequences from encode_sequences.
+        :param selection: A slice, integer index array or boolean mask of the sequences to keep.
+        :return: A dictionary of the selected encoded sequences sharing the codes of the original.
+        """
+        return {
+            'ids': encoded['ids'][selection],
+            'codes': encoded['codes'],
+            'starts': encoded['starts'][selection],
+            'lengths': encoded['lengths'][selection],
+            'alphabet': encoded['alphabet']
+        }
+
+    @staticmethod
+    def iter_batches(source, batch_size: int = None, alphabet: str = None):
+        """
+        Yields batches of encoded sequences from either encoded sequences or a stream of records.
+        Records are only encoded one batch at a time, so the full input never has to be held in memory.
+
+        :param source: A dictionary of encoded sequences or an iterable of (sequence_id, sequence) records.
+        :param batch_size: Number of sequences per batch. Defaults to PSWMScanner.batch_size.
+        :param alphabet: The ordered alphabet used to encode records. Defaults to PSWMScanner.alphabet.
+        :return: A generator of dictionaries of encoded sequences.
+        """
+        if batch_size is None:
+            batch_size = PSWMScanner.batch_size
+
+        # Already encoded sequences are split into batches by their offsets
+        if isinstance(source, dict):
+            for batch_start in range(0, len(source['ids']), batch_size):
+                yield PSWMScanner.subset_encoded(source, slice(batch_start, batch_start + batch_size))
+            return
+
+        # Records are accumulated until a batch is full and then encoded together
+        batch_ids, batch_sequences = [], []
+        for sequence_id, sequence in source:
+            batch_ids.append(sequence_id)
+            batch_sequences.append(sequence)
+
+            if len(batch_ids) == batch_size:
+                yield PSWMScanner.encode_sequences(batch_sequences, batch_ids, alphabet)
+                batch_ids, batch_sequences = [], []
+
+        # Encode the final partial batch
+        if batch_ids:
+            yield PSWMScanner.encode_sequences(batch_sequences, batch_ids, alphabet)
+
+    @staticmethod
+    def decode_windows(encoded: dict, window_starts: np.ndarray, window_length: int) -> np.ndarray:
+        """
+        Decodes windows of the flat code array back into strings. Unrecognized codes decode as 'n'.
+
+        :param encoded: The dictionary of encoded sequences from encode_sequences.
+        :param window_starts: The positions of the windows within the flat code array.
+        :param window_length: The length of each window.
+        :return: A Numpy array of the window strings.
+        """
+        # Lookup table from the codes back to the characters of the alphabet
+        characters = np.frombuffer((encoded['alphabet'] + 'n').encode('ascii'), dtype=np.uint8)
+
+        # Gather the codes of each window as a 2D array
+        window_codes = np.lib.stride_tricks.sliding_window_view(encoded['codes'], window_length)[window_starts]
+
+        # View each row of characters as a single fixed width byte string
+        window_bytes = np.ascontiguousarray(characters[window_codes]).view(f'S{window_length}').ravel()
+
+        return window_bytes.astype(str)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Counts Matrix -> PSWM Methods #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def format_counts_matrix_df(raw_counts_matrix_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Formats a raw counts matrix as read from a headerless TSV with the layout 'base | count count ...'.
+        The base becomes the index, the formatting column is dropped and the positions are named P1 to Pn.
+
+        :param raw_counts_matrix_df: The raw counts matrix DataFrame.
+        :return: The counts matrix DataFrame indexed by base with a column per motif position.
+        """
+        # Use the base as the index and drop the formatting column
+        counts_matrix_df = raw_counts_matrix_df.set_index(0).drop(1, axis='columns')
+
+        # Rename the columns to P1 to Pn to represent the position
+        counts_matrix_df.columns = [f"P{i}" for i in range(1, len(counts_matrix_df.columns) + 1)]
+
+        return counts_matrix_df
+
+    @staticmethod
+    def read_counts_matrix(file_name: str, input_format: str = 'tsv') -> pd.DataFrame:
+        """
+        Reads a counts matrix file from the DataIO input folder and formats it with format_counts_matrix_df.
+
+        :param file_name: The name of the counts matrix file within the input folder.
+        :param input_format: The encode format to read the file as.
+        :return: The counts matrix DataFrame indexed by base with a column per motif position.
+        """
+        raw_counts_matrix_df = Jio.file_to_df(
+            file_name=file_name,
+            return_dict=False,
+            force_encode_format=input_format,
+            read_args={"header": None}
+        )
+        return PSWMScanner.format_counts_matrix_df(raw_counts_matrix_df)
+
+    # Function takes a counts matrix df and returns it with the psuedo count applied
+    @staticmethod
+    def add_psuedocount(counts_matrix_df, psuedocount=1):
+        # Add one to all positions in the counts matrix
+        pseudocounts_matrix_df = counts_matrix_df + psuedocount
+        return pseudocounts_matrix_df
+
+    # Computes the Frequency Matrix from the Counts Matrix
+    @staticmethod
+    def counts_to_frequency_matrix_df(counts_matrix_df):
+        # Calculate the sum of each column (each position in the motif)
+        column_sums = counts_matrix_df.sum()
+
+        # Divide each element in the DataFrame by its column sum to get frequencies
+        frequency_matrix_df = counts_matrix_df.div(column_sums, axis='columns')
+
+        # Return the Frequency Matrix
+        return frequency_matrix_df
+
+    # Computes matrix of the log odds ratio between frequency and expected frequency
+    # Expected P is the probability a nucleotide should appear (base is 1 / 4)
+    # Background is set to 1
+    @staticmethod
+    def frequency_to_log_odds_matrix_df(frequency_matrix_df, expected_probability=(1/4), background=1,
+                                        frequency_uses_pseudocount=True):
+
+        # If the frequency matrix already adjusts via psuedocount
+        if frequency_uses_pseudocount:
+            # Formula is Ln ( Frequency / Expected Frequency ) / Background
+            log_odds_matrix_df = (
+                    np.log(frequency_matrix_df / expected_probability)
+                    /
+                    background
+            )
+
+        # If the psuedocount is not previously adjusted, add a minor amount to prevent ln(0)
+        else:
+            # Set an insignificant adjustment to prevent division log of zero
+            adjustment = 1e-100
+
+            # Return the Log Odds Matrix with an Adjustment Factor
+            log_odds_matrix_df = (
+                np.log(
+                    (frequency_matrix_df + adjustment)
+                    /
+                    (expected_probability + adjustment)
+                )
+                /
+                background
+            )
+
+        # Return the Log Odds Matrix DF
+        return log_odds_matrix_df
+
+    # Function combines the stages of generating a PSW|PSS Matrix
+    @staticmethod
+    def count_matrix_to_pswm_df(counts_matrix_df):
+
+        # Get the Psuedocount Matrix
+        psuedocounts_matrix_df = PSWMScanner.add_psuedocount(counts_matrix_df)
+
+        # Get the Frequency Matrix from the Counts Matrix with Psuedocount
+        psuedocount_frequency_matrix_df = PSWMScanner.counts_to_frequency_matrix_df(psuedocounts_matrix_df)
+
+        # Get the Log Odds Ratio Frequency Matrix from the Frequency Matrix
+        pswm_df = PSWMScanner.frequency_to_log_odds_matrix_df(
+            psuedocount_frequency_matrix_df, expected_probability=(1/4), background=1, frequency_uses_pseudocount=True
+        )
+
+        # Return the Position Specific Weight|Scoring Matrix
+        return pswm_df
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  PSWM Scoring Methods          #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def pswm_to_weights(pswm_df: pd.DataFrame, alphabet: str = None) -> np.ndarray:
+        """
+        Converts a PSWM DataFrame (bases as the index, positions as the columns) into a weight array
+        whose rows follow the integer codes of the alphabet. An extra final row scores unrecognized bases as -inf.
+
+        :param pswm_df: The PSWM as a DataFrame.
+        :param alphabet: The ordered alphabet of the codes. Defaults to PSWMScanner.alphabet.
+        :return: A float64 Numpy array of shape (len(alphabet) + 1, motif_length).
+        """
+        if alphabet is None:
+            alphabet = PSWMScanner.alphabet
+
+        # Match the PSWM index case-insensitively to the alphabet
+        pswm_bases = [str(base).lower() for base in pswm_df.index]
+        missing_bases = set(alphabet.lower()) - set(pswm_bases)
+        if missing_bases:
+            raise ValueError(f"PSWM does not contain rows for the alphabet characters: {missing_bases}")
+
+        # Order the rows of the PSWM by the alphabet codes
+        rows = [pswm_bases.index(base) for base in alphabet.lower()]
+        weights = np.full((len(alphabet) + 1, pswm_df.shape[1]), -np.inf, dtype=np.float64)
+        weights[:len(alphabet)] = pswm_df.to_numpy(dtype=np.float64)[rows]
+
+        return weights
+
+    @staticmethod
+    def reverse_complement_weights(weights: np.ndarray, alphabet: str = None) -> np.ndarray:
+        """
+        Reverse complements a weight array so the encoded forward strand can be scored for reverse strand hits.
+        The score of a window under the reversed weights equals the score of its reverse complement.
+
+        :param weights: The weight array from pswm_to_weights.
+        :param alphabet: The ordered alphabet of the codes. Defaults to PSWMScanner.alphabet.
+        :return: The reverse complemented weight array with the same shape.
+        """
+        if alphabet is None:
+            alphabet = PSWMScanner.alphabet
+
+        # Row of each complementary base, the unrecognized row remains in place
+        try:
+            complement_rows = [alphabet.lower().index(PSWMScanner.complements[base]) for base in alphabet.lower()]
+        except (KeyError, ValueError):
+            raise ValueError(f"Alphabet {alphabet} is not closed under base complements")
+        complement_rows.append(len(alphabet))
+
+        # Swap each base for its complement and reverse the motif positions
+        return weights[complement_rows, ::-1]
+
+    @staticmethod
+    def strand_weights(pswm_df: pd.DataFrame, alphabet: str = None, both_strands: bool = False) -> np.ndarray:
+        """
+        Builds the weight array of a PSWM, optionally stacked with its reverse complement along a last strand axis.
+
+        :param pswm_df: The PSWM as a DataFrame.
+        :param alphabet: The ordered alphabet of the codes. Defaults to PSWMScanner.alphabet.
+        :param both_strands: If True, stacks the forward and reverse complement weights.
+        :return: A weight array of shape (len(alphabet) + 1, motif_length) or (len(alphabet) + 1, motif_length, 2).
+        """
+        weights = PSWMScanner.pswm_to_weights(pswm_df, alphabet)
+
+        if both_strands:
+            weights = np.stack([weights, PSWMScanner.reverse_complement_weights(weights, alphabet)], axis=-1)
+
+        return weights
+
+    @staticmethod
+    def score_codes(codes: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """
+        Scores every window of a flat code array against a weight array with one gather per motif position.
+        The score at position i is the sum of weights[codes[i + j], j] over the motif positions j.
+        Windows that run past the end of the array contain only partial sums and should be masked by the caller.
+        Any trailing axes of the weights (such as the strand axis) are scored in the same gather.
+
+        :param codes: The flat uint8 array of integer codes.
+        :param weights: The weight array from pswm_to_weights or strand_weights.
+        :return: A float64 Numpy array of scores of shape (len(codes),) + weights.shape[2:].
+        """
+        scores = np.zeros((len(codes),) + weights.shape[2:], dtype=np.float64)
+
+        # Accumulate the weight of each motif position across all windows at once
+        for position in range(min(weights.shape[1], len(codes))):
+            scores[:len(codes) - position] += np.take(weights[:, position], codes[position:], axis=0)
+
+        return scores
+
+    @staticmethod
+    def score_matrix(
+            encoded: dict,
+            pswm_df: pd.DataFrame,
+            batch_size: int = None,
+            both_strands: bool = False
+    ) -> np.ndarray:
+        """
+        Scores all windows of all encoded sequences against the PSWM.
+        Row i holds the scores of the windows of sequence i by their start position within the sequence.
+        Positions without a complete window, or windows containing unrecognized bases, are scored as -inf.
+
+        :param encoded: The dictionary of encoded sequences from encode_sequences.
+        :param pswm_df: The PSWM as a DataFrame.
+        :param batch_size: Number of sequences scored per batch. Defaults to PSWMScanner.batch_size.
+        :param both_strands: If True, also scores the reverse strand with the reverse complemented PSWM.
+        :return: A float64 Numpy array of shape (sequence_count, max_window_count),
+                 with a last strand axis of size 2 (forward, reverse) if both_strands is True.
+        """
+        weights = PSWMScanner.strand_weights(pswm_df, encoded['alphabet'], both_strands)
+
+        return PSWMScanner.score_weights(encoded, weights, batch_size=batch_size)
+
+    @staticmethod
+    def score_weights(
+            encoded: dict,
+            weights: np.ndarray,
+            motif_lengths: np.ndarray = None,
+            batch_size: int = None
+    ) -> np.ndarray:
+        """
+        Scores all windows of all encoded sequences against a weight array with any trailing motif axes
+        (such as the strand axis or the motif axis of a stacked PSWM library).
+        Windows are only complete when they fit within the sequence for the motif length of their trailing index.
+
+        :param encoded: The dictionary of encoded sequences from encode_sequences.
+        :param weights: The weight array of shape (len(alphabet) + 1, max_motif_length) + motif_axes.
+        :param motif_lengths: The motif length per trailing index, broadcastable to motif_axes.
+                              Defaults to the full length of the weights.
+        :param batch_size: Number of sequences scored per batch. Defaults to PSWMScanner.batch_size.
+        :return: A float64 Numpy array of shape (sequence_count, max_window_count) + motif_axes.
+        """
+        if batch_size is None:
+            batch_size = PSWMScanner.batch_size
+
+        motif_axes = weights.shape[2:]
+        if motif_lengths is None:
+            motif_lengths = weights.shape[1]
+        motif_lengths = np.broadcast_to(motif_lengths, motif_axes)
+
+        # Number of complete windows per sequence and motif, laid out as (sequence, window, *motif_axes)
+        starts, lengths = encoded['starts'], encoded['lengths']
+        window_counts = np.maximum(lengths.reshape((-1, 1) + (1,) * len(motif_axes)) - motif_lengths + 1, 0)
+        max_windows = int(window_counts.max(initial=0))
+
+        score_matrix = np.full((len(starts), max_windows) + motif_axes, -np.inf, dtype=np.float64)
+        window_positions = np.arange(max_windows).reshape((1, -1) + (1,) * len(motif_axes))
+
+        # Score the sequences in batches over the region of the flat array that the batch covers
+        for batch_start in range(0, len(starts), batch_size):
+            batch = slice(batch_start, batch_start + batch_size)
+            region_start = int(starts[batch].min(initial=0))
+            region_end = int((starts[batch] + lengths[batch]).max(initial=0))
+            if region_end <= region_start:
+                continue
+            region_scores = PSWMScanner.score_codes(encoded['codes'][region_start:region_end], weights)
+
+            # Gather the windows of each sequence into its row of the matrix and mask the incomplete windows
+            window_index = starts[batch, None] - region_start + np.arange(max_windows)
+            window_index = np.minimum(window_index, len(region_scores) - 1)
+            is_window = window_positions < window_counts[batch]
+            score_matrix[batch] = np.where(is_window, region_scores[window_index], -np.inf)
+
+        return score_matrix
+
+    @staticmethod
+    def best_strand(score_matrix: np.ndarray) -> tuple:
+        """
+        Collapses the strand axis of a both-strand score matrix to the best scoring strand of each window.
+        Ties are reported on the forward strand.
+
+        :param score_matrix: The both-strand score matrix from score_matrix.
+        :return: A tuple of the best scores and the strand index (0 forward, 1 reverse) of each window.
+        """
+        strands = score_matrix.argmax(axis=-1)
+        return np.take_along_axis(score_matrix, strands[..., None], axis=-1)[..., 0], strands
+
+    @staticmethod
+    def score_matrix_to_df(
+            score_matrix: np.ndarray,
+            encoded: dict,
+            motif_length: int,
+            id_column: str = 'GeneID',
+            position_offset: int = 0,
+            include_windows: bool = True
+    ) -> pd.DataFrame:
+        """
+        Converts a score matrix into a long DataFrame with one row per window,
+        in the same layout as partitioning each sequence into overlapping windows.
+        Both-strand score matrices report the best strand of each window in a 'Strand' column,
+        while the window sequence is always given on the forward strand.
+
+        :param score_matrix: The score matrix from score_matrix.
+        :param encoded: The dictionary of encoded sequences from encode_sequences.
+        :param motif_length: The length of the windows scored.
+        :param id_column: The name of the column for the sequence identifiers.
+        :param position_offset: Value added to the Start and End positions of each window.
+        :param include_windows: If True, includes the decoded window sequence as the 'Sequence_Partition' column.
+        :return: A DataFrame with the identifier, window, Start, End and Score columns.
+        """
+        # Rows and positions of each complete window
+        window_counts = np.maximum(encoded['lengths'] - motif_length + 1, 0)
+        rows = np.repeat(np.arange(len(window_counts)), window_counts)
+        positions = np.arange(len(rows)) - np.repeat(np.cumsum(window_counts) - window_counts, window_counts)
+
+        long_df = pd.DataFrame({id_column: encoded['ids'][rows]})
+
+        if include_windows:
+            long_df['Sequence_Partition'] = PSWMScanner.decode_windows(
+                encoded, encoded['starts'][rows] + positions, motif_length
+            )
+
+        long_df['Start'] = positions + position_offset
+        long_df['End'] = positions + motif_length - 1 + position_offset
+
+        # Collapse the strand axis of both-strand score matrices
+        if score_matrix.ndim == 3:
+            score_matrix, strands = PSWMScanner.best_strand(score_matrix)
+            long_df['Strand'] = PSWMScanner.strand_labels[strands[rows, positions]]
+
+        long_df['Score'] = score_matrix[rows, positions]
+
+        return long_df
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Score Significance Methods    #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def score_distribution(
+            pswm_df: pd.DataFrame,
+            expected_probability: float | dict = (1/4),
+            resolution: float = None,
+            reverse_strand: bool = False,
+            alphabet: str = None
+    ) -> dict:
+        """
+        Computes the exact distribution of PSWM scores of random windows under the background model
+        with dynamic programming over the motif positions. Weights are rounded to bins of the given resolution,
+        so looked up p-values are exact for the binned scores (within motif_length * resolution / 2 of the score).
+        Distributions are cached, so each motif is only computed once.
+
+        :param pswm_df: The PSWM as a DataFrame.
+        :param expected_probability: Background probability of each base, either one value for all bases
+                                     or a dictionary of base to probability.
+        :param resolution: Width of the score bins. Defaults to PSWMScanner.score_resolution.
+        :param reverse_strand: If True, computes the distribution of the reverse complemented PSWM.
+        :param alphabet: The ordered alphabet of the codes. Defaults to PSWMScanner.alphabet.
+        :return: A dictionary with the 'resolution', the 'min_bin' of the distribution,
+                 the 'pmf' per score bin and the 'survival' P(score >= bin) per score bin.
+        """
+        if resolution is None:
+            resolution = PSWMScanner.score_resolution
+        if alphabet is None:
+            alphabet = PSWMScanner.alphabet
+
+        weights = PSWMScanner.strand_weights(pswm_df, alphabet, both_strands=reverse_strand)
+        if reverse_strand:
+            weights = weights[..., 1]
+        weights = weights[:len(alphabet)]
+
+        # Background probability per base code
+        if isinstance(expected_probability, dict):
+            background = np.array([expected_probability[base] for base in alphabet], dtype=np.float64)
+        else:
+            background = np.full(len(alphabet), expected_probability, dtype=np.float64)
+
+        if not np.isfinite(weights).all():
+            raise ValueError("PSWM contains non-finite weights, apply a psuedocount before computing p-values")
+
+        # Return the cached distribution if this motif has already been computed
+        cache_key = (weights.tobytes(), weights.shape, background.tobytes(), resolution)
+        if cache_key in PSWMScanner._score_distributions:
+            return PSWMScanner._score_distributions[cache_key]
+
+        # Integer score bins of each base at each position
+        weight_bins = np.rint(weights / resolution).astype(np.int64)
+
+        # Add one motif position at a time, shifting the distribution by the bin of each base
+        pmf = np.ones(1, dtype=np.float64)
+        min_bin = 0
+        for position in range(weight_bins.shape[1]):
+            position_bins = weight_bins[:, position] - weight_bins[:, position].min()
+            next_pmf = np.zeros(len(pmf) + position_bins.max(), dtype=np.float64)
+            for base_bin, base_probability in zip(position_bins, background):
+                next_pmf[base_bin:base_bin + len(pmf)] += base_probability * pmf
+            pmf = next_pmf
+            min_bin += int(weight_bins[:, position].min())
+
+        # Survival function P(score >= bin) from the highest bin down
+        survival = np.cumsum(pmf[::-1])[::-1]
+
+        score_distribution = {
+            'resolution': resolution,
+            'min_bin': min_bin,
+            'pmf': pmf,
+            'survival': survival
+        }
+        PSWMScanner._score_distributions[cache_key] = score_distribution
+
+        return score_distribution
+
+    @staticmethod
+    def score_to_pvalue(
+            scores: np.ndarray,
+            pswm_df: pd.DataFrame,
+            strands: np.ndarray = None,
+            expected_probability: float | dict = (1/4),
+            resolution: float = None
+    ) -> np.ndarray:
+        """
+        Converts PSWM scores into p-values, the probability of a random window scoring at least as high,
+        with an O(1) lookup per score into the cached score distribution.
+
+        :param scores: The scores to convert.
+        :param pswm_df: The PSWM as a DataFrame.
+        :param strands: Optionally the strand of each score as '+'/'-' or 0/1, to look up reverse strand scores
+                        in the distribution of the reverse complemented PSWM.
+        :param expected_probability: Background probability of each base, as in score_distribution.
+        :param resolution: Width of the score bins. Defaults to PSWMScanner.score_resolution.
+        :return: A float64 Numpy array of p-values. Scores of -inf have a p-value of (about) 1.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        pvalues = np.ones(scores.shape, dtype=np.float64)
+
+        if strands is None:
+            is_reverse = np.zeros(scores.shape, dtype=bool)
+        else:
+            strands = np.asarray(strands)
+            is_reverse = (strands == '-') | (strands == 1)
+
+        # Look up each strand in its own score distribution
+        for reverse_strand in (False, True):
+            is_strand = is_reverse == reverse_strand
+            if not is_strand.any():
+                continue
+
+            score_distribution = PSWMScanner.score_distribution(
+                pswm_df, expected_probability, resolution, reverse_strand
+            )
+            # Survival with a trailing 0 for scores above the highest bin
+            survival = np.append(score_distribution['survival'], 0.0)
+
+            # Bin of each score, where -inf falls into the lowest bin and +inf past the highest
+            score_bins = np.rint(scores[is_strand] / score_distribution['resolution']) - score_distribution['min_bin']
+            score_bins = np.clip(score_bins, 0, len(survival) - 1).astype(np.int64)
+
+            pvalues[is_strand] = survival[score_bins]
+
+        return pvalues
+
+    @staticmethod
+    def pvalue_to_score_threshold(
+            pvalue: float,
+            pswm_df: pd.DataFrame,
+            expected_probability: float | dict = (1/4),
+            resolution: float = None
+    ) -> float:
+        """
+        Finds the lowest score whose p-value is at most the given p-value, for threshold-based calling of hits.
+
+        :param pvalue: The p-value threshold.
+        :param pswm_df: The PSWM as a DataFrame.
+        :param expected_probability: Background probability of each base, as in score_distribution.
+        :param resolution: Width of the score bins. Defaults to PSWMScanner.score_resolution.
+        :return: The score threshold, or inf if no score reaches the p-value.
+        """
+        score_distribution = PSWMScanner.score_distribution(pswm_df, expected_probability, resolution)
+
+        # The survival function decreases with the score, so the first bin at or below the p-value is the threshold
+        significant_bins = np.nonzero(score_distribution['survival'] <= pvalue)[0]
+        if len(significant_bins) == 0:
+            return np.inf
+
+        # Lower edge of the bin, so every score rounding into the bin passes the threshold
+        threshold_bin = significant_bins[0] + score_distribution['min_bin']
+        return (threshold_bin - 0.5) * score_distribution['resolution']
+
+    @staticmethod
+    def add_pvalues(
+            hits_df: pd.DataFrame,
+            pswm_df: pd.DataFrame,
+            expected_probability: float | dict = (1/4),
+            resolution: float = None
+    ) -> pd.DataFrame:
+        """
+        Adds a 'P_Value' column to a DataFrame of hits with a 'Score' (and optionally a 'Strand') column.
+
+        :param hits_df: The DataFrame of hits.
+        :param pswm_df: The PSWM the hits were scored with.
+        :param expected_probability: Background probability of each base, as in score_distribution.
+        :param resolution: Width of the score bins. Defaults to PSWMScanner.score_resolution.
+        :return: A copy of the hits DataFrame with the 'P_Value' column.
+        """
+        hits_df = hits_df.copy()
+        hits_df['P_Value'] = PSWMScanner.score_to_pvalue(
+            hits_df['Score'].to_numpy(),
+            pswm_df,
+            hits_df['Strand'].to_numpy() if 'Strand' in hits_df.columns else None,
+            expected_probability,
+            resolution
+        )
+        return hits_df
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  PSWM Library Methods          #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def build_pswm_library(counts_matrices: dict | list) -> dict:
+        """
+        Builds the PSWMs of a library of counts matrices with count_matrix_to_pswm_df.
+
+        :param counts_matrices: A dictionary of motif names to counts matrix DataFrames,
+                                or a list of counts matrix file names within the DataIO input folder.
+        :return: A dictionary of motif names to PSWM DataFrames.
+        """
+        # Read counts matrix files, naming each motif by its file name
+        if not isinstance(counts_matrices, dict):
+            counts_matrices = {
+                file_name.split('.')[0]: PSWMScanner.read_counts_matrix(file_name)
+                for file_name in counts_matrices
+            }
+
+        return {
+            motif_name: PSWMScanner.count_matrix_to_pswm_df(counts_matrix_df)
+            for motif_name, counts_matrix_df in counts_matrices.items()
+        }
+
+    @staticmethod
+    def stack_pswm_library(pswm_library: dict, alphabet: str = None, both_strands: bool = False) -> dict:
+        """
+        Stacks a library of PSWMs of differing lengths into a single weight tensor.
+        Shorter motifs are padded at their end with zero weights, which score any base (even unrecognized) as 0.
+
+        :param pswm_library: A dictionary of motif names to PSWM DataFrames.
+        :param alphabet: The ordered alphabet of the codes. Defaults to PSWMScanner.alphabet.
+        :param both_strands: If True, adds a last strand axis of the forward and reverse complement weights.
+        :return: A dictionary with the motif 'names', the 'weights' tensor of shape
+                 (len(alphabet) + 1, max_motif_length, motif_count[, 2]) and the 'motif_lengths'.
+        """
+        if alphabet is None:
+            alphabet = PSWMScanner.alphabet
+
+        motif_names = list(pswm_library.keys())
+        motif_lengths = np.array([len(pswm_library[name].columns) for name in motif_names], dtype=np.int64)
+        max_length = int(motif_lengths.max(initial=0))
+
+        weights = np.zeros((len(alphabet) + 1, max_length, len(motif_names)) + ((2,) if both_strands else ()))
+
+        # Reverse complement each motif before padding so the padding stays at the end of both strands
+        for motif_index, motif_name in enumerate(motif_names):
+            motif_weights = PSWMScanner.strand_weights(pswm_library[motif_name], alphabet, both_strands)
+            weights[:, :motif_lengths[motif_index], motif_index] = motif_weights
+
+        return {
+            'names': motif_names,
+            'weights': weights,
+            'motif_lengths': motif_lengths[:, None] if both_strands else motif_lengths
+        }
+
+    @staticmethod
+    def score_library(
+            encoded: dict,
+            pswm_library: dict,
+            batch_size: int = None,
+            both_strands: bool = False
+    ) -> dict:
+        """
+        Scores every motif of a PSWM library against the encoded sequences in one batched gather per position.
+
+        :param encoded: The dictionary of encoded sequences from encode_sequences.
+        :param pswm_library: A dictionary of motif names to PSWM DataFrames.
+        :param batch_size: Number of sequences scored per batch. Defaults to PSWMScanner.batch_size / motif count.
+        :param both_strands: If True, also scores the reverse strand of each motif.
+        :return: A dictionary with the motif 'names', their 'motif_lengths' and the 'scores' tensor of shape
+                 (sequence_count, max_window_count, motif_count[, 2]).
+        """
+        stacked_library = PSWMScanner.stack_pswm_library(pswm_library, encoded['alphabet'], both_strands)
+
+        # Shrink the batches so a batch of the library uses the memory of a batch of a single motif
+        if batch_size is None:
+            batch_size = max(PSWMScanner.batch_size // max(len(stacked_library['names']), 1), 1)
+
+        return {
+            'names': stacked_library['names'],
+            'motif_lengths': stacked_library['motif_lengths'].reshape(-1),
+            'scores': PSWMScanner.score_weights(
+                encoded, stacked_library['weights'], stacked_library['motif_lengths'], batch_size
+            )
+        }
+
+    @staticmethod
+    def scan_library_top_hits(
+            source,
+            pswm_library: dict,
+            top_k: int = 30,
+            score_threshold: float = None,
+            keep_best_per_sequence: bool = True,
+            batch_size: int = None,
+            id_column: str = 'GeneID',
+            position_offset: int = 0,
+            both_strands: bool = False
+    ) -> dict:
+        """
+        Streams sequences through a batched scan of a whole PSWM library, collecting the hits of each motif.
+        Each batch of sequences is encoded and gathered once for all motifs.
+
+        :param source: A dictionary of encoded sequences or an iterable of (sequence_id, sequence) records.
+        :param pswm_library: A dictionary of motif names to PSWM DataFrames.
+        :param top_k: Number of sequences to keep in the top hits of each motif by their best score.
+        :param score_threshold: Optionally keeps every window scoring at or above the threshold.
+        :param keep_best_per_sequence: If True, keeps the best hit of every sequence for each motif.
+        :param batch_size: Number of sequences scored per batch. Defaults to PSWMScanner.batch_size / motif count.
+        :param id_column: The name of the column for the sequence identifiers.
+        :param position_offset: Value added to the Start and End positions of each hit.
+        :param both_strands: If True, scores both strands and reports the strand of each hit.
+        :return: A dictionary of motif names to the hit DataFrames of MotifHitCollector.results.
+        """
+        stacked_library = PSWMScanner.stack_pswm_library(pswm_library, both_strands=both_strands)
+        motif_lengths = stacked_library['motif_lengths'].reshape(-1)
+
+        if batch_size is None:
+            batch_size = max(PSWMScanner.batch_size // max(len(stacked_library['names']), 1), 1)
+
+        collectors = [
+            MotifHitCollector(
+                motif_length=int(motif_length),
+                top_k=top_k,
+                score_threshold=score_threshold,
+                keep_best_per_sequence=keep_best_per_sequence,
+                id_column=id_column,
+                position_offset=position_offset,
+                both_strands=both_strands
+            )
+            for motif_length in motif_lengths
+        ]
+
+        for encoded_batch in PSWMScanner.iter_batches(source, batch_size):
+            batch_scores = PSWMScanner.score_weights(
+                encoded_batch, stacked_library['weights'], stacked_library['motif_lengths'], batch_size
+            )
+
+            # Hand each motif its own windows of the batch
+            for motif_index, collector in enumerate(collectors):
+                window_counts = np.maximum(encoded_batch['lengths'] - motif_lengths[motif_index] + 1, 0)
+                collector.add_batch(encoded_batch, batch_scores[:, :int(window_counts.max(initial=0)), motif_index])
+
+        return {
+            motif_name: collector.results()
+            for motif_name, collector in zip(stacked_library['names'], collectors)
+        }
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Streaming Scan Methods        #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def scan_top_hits(
+            source,
+            pswm_df: pd.DataFrame,
+            top_k: int = 30,
+            score_threshold: float = None,
+            keep_best_per_sequence: bool = True,
+            batch_size: int = None,
+            id_column: str = 'GeneID',
+            position_offset: int = 0,
+            both_strands: bool = False
+    ) -> dict:
+        """
+        Scans sequences batch by batch with the PSWM and streams the scores into a MotifHitCollector.
+        Only one batch of scores exists at a time, so the full table of scored windows is never built.
+
+        :param source: A dictionary of encoded sequences or an iterable of (sequence_id, sequence) records.
+        :param pswm_df: The PSWM as a DataFrame.
+        :param top_k: Number of sequences to keep in the top hits by their best score.
+        :param score_threshold: Optionally keeps every window scoring at or above the threshold.
+        :param keep_best_per_sequence: If True, keeps the best hit of every sequence.
+        :param batch_size: Number of sequences scored per batch. Defaults to PSWMScanner.batch_size.
+        :param id_column: The name of the column for the sequence identifiers.
+        :param position_offset: Value added to the Start and End positions of each hit.
+        :param both_strands: If True, scores both strands and reports the strand of each hit.
+        :return: A dictionary of hit DataFrames as returned by MotifHitCollector.results.
+        """
+        collector = MotifHitCollector(
+            motif_length=len(pswm_df.columns),
+            top_k=top_k,
+            score_threshold=score_threshold,
+            keep_best_per_sequence=keep_best_per_sequence,
+            id_column=id_column,
+            position_offset=position_offset,
+            both_strands=both_strands
+        )
+
+        # Score each batch and hand it to the collector before moving onto the next
+        for encoded_batch in PSWMScanner.iter_batches(source, batch_size):
+            collector.add_batch(
+                encoded_batch, PSWMScanner.score_matrix(encoded_batch, pswm_df, batch_size, both_strands)
+            )
+
+        return collector.results()
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Parallel Scan Methods         #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def scan_top_hits_parallel(
+            encoded: dict,
+            pswm_df: pd.DataFrame,
+            top_k: int = 30,
+            score_threshold: float = None,
+            keep_best_per_sequence: bool = True,
+            max_workers: int = None,
+            shard_count: int = None,
+            batch_size: int = None,
+            id_column: str = 'GeneID',
+            position_offset: int = 0,
+            both_strands: bool = False
+    ) -> dict:
+        """
+        Scans encoded sequences with scan_top_hits across a process pool.
+        The flat array of codes is placed in shared memory once, so each worker reads it without copying,
+        and only the offsets of its shard of sequences are sent to it. Codes memory-mapped from an encoded
+        sequence store are instead mapped by each worker from the same file, sharing its pages.
+        The hits of each shard are merged into the same layout as scan_top_hits.
+
+        :param encoded: The dictionary of encoded sequences from encode_sequences.
+        :param pswm_df: The PSWM as a DataFrame.
+        :param top_k: Number of sequences to keep in the top hits by their best score.
+        :param score_threshold: Optionally keeps every window scoring at or above the threshold.
+        :param keep_best_per_sequence: If True, keeps the best hit of every sequence.
+        :param max_workers: Number of worker processes. Defaults to the CPU count.
+        :param shard_count: Number of shards of sequences. Defaults to 4 shards per worker.
+        :param batch_size: Number of sequences scored per batch within a worker.
+        :param id_column: The name of the column for the sequence identifiers.
+        :param position_offset: Value added to the Start and End positions of each hit.
+        :param both_strands: If True, scores both strands and reports the strand of each hit.
+        :return: A dictionary of hit DataFrames as returned by MotifHitCollector.results.
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if shard_count is None:
+            shard_count = max_workers * 4
+
+        # Contiguous shards of sequences keep the merged hits in the order of the sequences
+        shards = [shard for shard in np.array_split(np.arange(len(encoded['ids'])), shard_count) if len(shard)]
+
+        scan_args = {
+            'pswm_df': pswm_df,
+            'top_k': top_k,
+            'score_threshold': score_threshold,
+            'keep_best_per_sequence': keep_best_per_sequence,
+            'batch_size': batch_size,
+            'id_column': id_column,
+            'position_offset': position_offset,
+            'both_strands': both_strands
+        }
+
+        # Memory-mapped codes are shared through their file, other codes are copied into shared memory once
+        codes = encoded['codes']
+        if isinstance(codes, np.memmap) and codes.filename is not None:
+            shared_codes = None
+            codes_source = ('memmap', codes.filename, codes.offset)
+        else:
+            codes = np.ascontiguousarray(codes)
+            shared_codes = shared_memory.SharedMemory(create=True, size=max(codes.nbytes, 1))
+            np.ndarray(codes.shape, dtype=np.uint8, buffer=shared_codes.buf)[:] = codes
+            codes_source = ('shared_memory', shared_codes.name, 0)
+
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                shard_results = list(executor.map(
+                    PSWMScanner._scan_shared_shard,
+                    [codes_source] * len(shards),
+                    [len(codes)] * len(shards),
+                    [{
+                        'ids': shard,
+                        'starts': encoded['starts'][shard],
+                        'lengths': encoded['lengths'][shard],
+                        'alphabet': encoded['alphabet']
+                    } for shard in shards],
+                    [scan_args] * len(shards)
+                ))
+        finally:
+            if shared_codes is not None:
+                shared_codes.close()
+                shared_codes.unlink()
+
+        return PSWMScanner._merge_shard_results(shard_results, encoded['ids'], top_k, id_column)
+
+    @staticmethod
+    def _scan_shared_shard(codes_source: tuple, code_count: int, shard: dict, scan_args: dict) -> dict:
+        # Worker process: attach to the shared codes and scan the shard of sequences
+        # The shard IDs are the positions of the sequences, which are mapped back to the real IDs on merging
+        source_type, source_name, source_offset = codes_source
+
+        if source_type == 'memmap':
+            shard['codes'] = np.memmap(source_name, dtype=np.uint8, mode='r', offset=source_offset, shape=(code_count,))
+            return PSWMScanner.scan_top_hits(shard, **scan_args)
+
+        shared_codes = shared_memory.SharedMemory(name=source_name)
+        try:
+            shard['codes'] = np.ndarray((code_count,), dtype=np.uint8, buffer=shared_codes.buf)
+            results = PSWMScanner.scan_top_hits(shard, **scan_args)
+        finally:
+            # Release the view of the shared buffer before closing it
+            shard.pop('codes', None)
+            shared_codes.close()
+
+        return results
+
+    @staticmethod
+    def _merge_shard_results(shard_results: list, ids: np.ndarray, top_k: int, id_column: str) -> dict:
+        # Merges the hits of each shard, keeping the top k by descending score and then by sequence order
+        merged_results = {}
+        for result_name in shard_results[0].keys() if shard_results else []:
+            merged_df = pd.concat([result[result_name] for result in shard_results], ignore_index=True)
+
+            if result_name == 'top':
+                merged_df = merged_df.assign(_Order=merged_df[id_column].astype(np.int64))
+                merged_df = merged_df.sort_values(by=['Score', '_Order'], ascending=[False, True]).head(top_k)
+                merged_df = merged_df.drop(columns='_Order').reset_index(drop=True)
+
+            # Map the sequence positions back to their IDs
+            merged_df[id_column] = ids[merged_df[id_column].to_numpy(dtype=np.int64)]
+            merged_results[result_name] = merged_df
+
+        return merged_results
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+#  Motif Hit Collector Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class MotifHitCollector:
+    """
+    Collects the hits of a PSWM scan one batch of scores at a time.
+    Keeps the best hit per sequence, a bounded heap of the top k sequences by best score,
+    and optionally every hit at or above a score threshold. Memory is O(sequences + k) rather than O(windows).
+    """
+
+    def __init__(
+            self,
+            motif_length: int,
+            top_k: int = 30,
+            score_threshold: float = None,
+            keep_best_per_sequence: bool = True,
+            id_column: str = 'GeneID',
+            position_offset: int = 0,
+            both_strands: bool = False
+    ):
+        """
+        :param motif_length: The length of the windows scored.
+        :param top_k: Number of sequences to keep in the top hits by their best score.
+        :param score_threshold: Optionally keeps every window scoring at or above the threshold.
+        :param keep_best_per_sequence: If True, keeps the best hit of every sequence.
+        :param id_column: The name of the column for the sequence identifiers.
+        :param position_offset: Value added to the Start and End positions of each hit.
+        :param both_strands: If True, expects both-strand score matrices and reports the strand of each hit.
+        """
+        self.motif_length = motif_length
+        self.top_k = top_k
+        self.score_threshold = score_threshold
+        self.keep_best_per_sequence = keep_best_per_sequence
+        self.id_column = id_column
+        self.position_offset = position_offset
+        self.both_strands = both_strands
+
+        # Number of sequences seen so far, used to break ties by the order of the sequences
+        self.sequence_count = 0
+
+        # Min-heap of (score, -order, id, position, window, strand) so the weakest top hit is popped first
+        self._top_heap = []
+        # Hits per batch held as tuples of (ids, positions, scores, windows, strands)
+        self._best_hits = []
+        self._threshold_hits = []
+
+    def add_batch(self, encoded_batch: dict, score_matrix: np.ndarray) -> None:
+        """
+        Adds the score matrix of a batch of encoded sequences to the collected hits.
+
+        :param encoded_batch: The dictionary of encoded sequences that were scored.
+        :param score_matrix: The score matrix of the batch from PSWMScanner.score_matrix.
+        :return: None
+        """
+        sequence_indices = np.arange(score_matrix.shape[0])
+
+        # Collapse both-strand scores to the best strand of each window
+        if self.both_strands:
+            score_matrix, strand_matrix = PSWMScanner.best_strand(score_matrix)
+        else:
+            strand_matrix = np.zeros(score_matrix.shape, dtype=np.int64)
+
+        # Best window per sequence; sequences without any complete window score as -inf
+        if score_matrix.shape[1] > 0:
+            best_positions = score_matrix.argmax(axis=1)
+            best_scores = score_matrix[sequence_indices, best_positions]
+        else:
+            best_positions = np.zeros(score_matrix.shape[0], dtype=np.int64)
+            best_scores = np.full(score_matrix.shape[0], -np.inf)
+        has_hit = np.isfinite(best_scores)
+
+        if self.keep_best_per_sequence:
+            best_rows = sequence_indices[has_hit]
+            self._best_hits.append(self._gather_hits(
+                encoded_batch, best_rows, best_positions[best_rows], best_scores[best_rows],
+                strand_matrix[best_rows, best_positions[best_rows]]
+            ))
+
+        # Only the k best sequences of the batch can enter the heap
+        candidates = sequence_indices[has_hit]
+        candidates = candidates[np.argsort(-best_scores[candidates], kind='stable')[:self.top_k]]
+        candidate_windows = PSWMScanner.decode_windows(
+            encoded_batch, encoded_batch['starts'][candidates] + best_positions[candidates], self.motif_length
+        ) if len(candidates) else []
+
+        for candidate, window in zip(candidates, candidate_windows):
+            hit = (
+                float(best_scores[candidate]),
+                -(self.sequence_count + int(candidate)),
+                encoded_batch['ids'][candidate],
+                int(best_positions[candidate]),
+                window,
+                int(strand_matrix[candidate, best_positions[candidate]])
+            )
+            if len(self._top_heap) < self.top_k:
+                heapq.heappush(self._top_heap, hit)
+            elif hit[:2] > self._top_heap[0][:2]:
+                heapq.heapreplace(self._top_heap, hit)
+
+        # Every window at or above the score threshold
+        if self.score_threshold is not None:
+            rows, positions = np.nonzero(score_matrix >= self.score_threshold)
+            self._threshold_hits.append(self._gather_hits(
+                encoded_batch, rows, positions, score_matrix[rows, positions], strand_matrix[rows, positions]
+            ))
+
+        self.sequence_count += score_matrix.shape[0]
+
+    def _gather_hits(self, encoded_batch, rows, positions, scores, strands) -> tuple:
+        # Decodes the windows of the hits and returns the hit arrays as a tuple
+        windows = PSWMScanner.decode_windows(
+            encoded_batch, encoded_batch['starts'][rows] + positions, self.motif_length
+        ) if len(rows) else np.array([], dtype=str)
+        return encoded_batch['ids'][rows], positions, scores, windows, strands
+
+    def _hits_to_df(self, ids, positions, scores, windows, strands) -> pd.DataFrame:
+        # Lays out hits in the same columns as PSWMScanner.score_matrix_to_df
+        positions = np.asarray(positions, dtype=np.int64)
+        hits_df = pd.DataFrame({
+            self.id_column: np.asarray(ids, dtype=object),
+            'Sequence_Partition': np.asarray(windows, dtype=object),
+            'Start': positions + self.position_offset,
+            'End': positions + self.motif_length - 1 + self.position_offset
+        })
+
+        if self.both_strands:
+            hits_df['Strand'] = PSWMScanner.strand_labels[np.asarray(strands, dtype=np.int64)]
+
+        hits_df['Score'] = np.asarray(scores, dtype=np.float64)
+
+        return hits_df
+
+    def _concat_hits(self, hits: list) -> pd.DataFrame:
+        # Joins the hits of all batches into a single DataFrame
+        if not hits:
+            return self._hits_to_df([], [], [], [], [])
+        return self._hits_to_df(*(np.concatenate(arrays) for arrays in zip(*hits)))
+
+    def results(self) -> dict:
+        """
+        Returns the collected hits as DataFrames.
+
+        :return: A dictionary with the 'top' hits sorted by descending score,
+                 the 'best' hit per sequence (if kept) and the 'threshold' hits (if a threshold was set).
+        """
+        # Sort the heap by descending score, breaking ties by the order of the sequences
+        top_hits = sorted(self._top_heap, reverse=True)
+        results = {
+            'top': self._hits_to_df(
+                [hit[2] for hit in top_hits],
+                [hit[3] for hit in top_hits],
+                [hit[0] for hit in top_hits],
+                [hit[4] for hit in top_hits],
+                [hit[5] for hit in top_hits]
+            )
+        }
+
+        if self.keep_best_per_sequence:
+            results['best'] = self._concat_hits(self._best_hits)
+
+        if self.score_threshold is not None:
+            results['threshold'] = self._concat_hits(self._threshold_hits)
+
+        return results
@@ -0,0 +1,135 @@
+# Import Libraries
+from itertools import product  # Enumeration of every Short Sequence
+import numpy as np  # Computation
+import pandas as pd  # Data Reading
+import pytest  # Test Parametrization
+from PSWMScanner import PSWMScanner  # Vectorized PSWM Scanning Class
+
+
+def random_pswm(motif_length, seed=528):
+    # PSWM from a random counts matrix in the layout of the counts matrix files (lower case bases, P1 to Pn)
+    rng = np.random.default_rng(seed)
+    counts_matrix_df = pd.DataFrame(
+        rng.integers(0, 25, size=(4, motif_length)),
+        index=list('acgt'),
+        columns=[f"P{i}" for i in range(1, motif_length + 1)]
+    )
+    return PSWMScanner.count_matrix_to_pswm_df(counts_matrix_df)
+
+
+def random_sequences(count, seed=528):
+    # Random sequences of mixed case and varying length, some shorter than the motif and some with unknown bases
+    rng = np.random.default_rng(seed)
+    sequences = [''.join(rng.choice(list('acgtACGT'), size=rng.integers(0, 40))) for _ in range(count)]
+    sequences[3] = sequences[3][:5] + 'n' + sequences[3][6:]
+    return sequences
+
+
+def naive_score(window, pswm_df):
+    # Sums the PSWM weight of each base of the window, with unknown bases scoring -inf
+    if any(base not in 'acgt' for base in window.lower()):
+        return -np.inf
+    return sum(pswm_df.loc[base, position] for base, position in zip(window.lower(), pswm_df.columns))
+
+
+def reverse_complement(sequence):
+    return sequence.lower().translate(str.maketrans('acgt', 'tgca'))[::-1]
+
+
+def naive_scores(sequences, pswm_df):
+    # Forward and reverse strand score of every window of every sequence with a per-window loop
+    motif_length = len(pswm_df.columns)
+    return [
+        [
+            (naive_score(sequence[i:i + motif_length], pswm_df),
+             naive_score(reverse_complement(sequence[i:i + motif_length]), pswm_df))
+            for i in range(len(sequence) - motif_length + 1)
+        ]
+        for sequence in sequences
+    ]
+
+
+def test_score_matrix_matches_naive_window_loop_on_both_strands():
+    pswm_df = random_pswm(6)
+    sequences = random_sequences(20)
+    expected = naive_scores(sequences, pswm_df)
+
+    encoded = PSWMScanner.encode_sequences(sequences)
+    both_strands = PSWMScanner.score_matrix(encoded, pswm_df, batch_size=7, both_strands=True)
+    forward = PSWMScanner.score_matrix(encoded, pswm_df, batch_size=7)
+
+    assert both_strands.shape == (len(sequences), max(len(windows) for windows in expected), 2)
+    np.testing.assert_array_equal(forward, both_strands[..., 0])
+
+    for row, windows in enumerate(expected):
+        if windows:
+            np.testing.assert_allclose(both_strands[row, :len(windows)], np.array(windows))
+        # Positions without a complete window are masked
+        assert np.isneginf(both_strands[row, len(windows):]).all()
+
+
+@pytest.mark.parametrize('both_strands', [False, True])
+def test_scan_top_hits_matches_full_sort(both_strands):
+    pswm_df = random_pswm(6)
+    sequences = random_sequences(60, seed=20)
+    top_k = 10
+
+    # Best window of each sequence from the naive scores, ranked by a full stable sort
+    best_hits = []
+    for order, windows in enumerate(naive_scores(sequences, pswm_df)):
+        scores = np.array([max(window) if both_strands else window[0] for window in windows])
+        if len(scores) and np.isfinite(scores.max()):
+            best_hits.append((order, int(scores.argmax()), scores.max()))
+    full_sort = sorted(best_hits, key=lambda hit: -hit[2])
+
+    results = PSWMScanner.scan_top_hits(
+        PSWMScanner.encode_sequences(sequences), pswm_df, top_k=top_k, batch_size=8, both_strands=both_strands
+    )
+
+    top_hits = results['top']
+    assert top_hits['GeneID'].tolist() == [hit[0] for hit in full_sort[:top_k]]
+    assert top_hits['Start'].tolist() == [hit[1] for hit in full_sort[:top_k]]
+    np.testing.assert_allclose(top_hits['Score'], [hit[2] for hit in full_sort[:top_k]])
+    assert top_hits['Sequence_Partition'].tolist() == [
+        sequences[order][start:start + 6].lower() for order, start, _ in full_sort[:top_k]
+    ]
+
+    # The best hit is kept for every sequence with a complete window
+    assert results['best']['GeneID'].tolist() == [hit[0] for hit in best_hits]
+    np.testing.assert_allclose(results['best']['Score'], [hit[2] for hit in best_hits])
+
+
+@pytest.mark.parametrize('expected_probability', [(1/4), {'a': 0.4, 'c': 0.1, 'g': 0.2, 't': 0.3}])
+@pytest.mark.parametrize('strand', ['+', '-'])
+def test_score_to_pvalue_matches_brute_force_enumeration(expected_probability, strand):
+    pswm_df = random_pswm(5)
+    resolution = 0.01
+
+    # Binned score and background probability of all 4^5 sequences of the motif length
+    weights = PSWMScanner.strand_weights(pswm_df, both_strands=True)[:4, :, int(strand == '-')]
+    weight_bins = np.rint(weights / resolution).astype(np.int64)
+    if isinstance(expected_probability, dict):
+        background = np.array([expected_probability[base] for base in 'acgt'])
+    else:
+        background = np.full(4, expected_probability)
+
+    codes = np.array(list(product(range(4), repeat=5)))
+    positions = np.arange(5)
+    sequence_bins = weight_bins[codes, positions].sum(axis=1)
+    sequence_probabilities = background[codes].prod(axis=1)
+
+    # P(score >= bin) of every reachable bin, queried at the score of the bin
+    query_bins = np.unique(sequence_bins)
+    brute_force = np.array([sequence_probabilities[sequence_bins >= query_bin].sum() for query_bin in query_bins])
+
+    pvalues = PSWMScanner.score_to_pvalue(
+        query_bins * resolution, pswm_df, strands=np.full(len(query_bins), strand),
+        expected_probability=expected_probability, resolution=resolution
+    )
+
+    np.testing.assert_allclose(pvalues, brute_force)
+    # Scores beyond either end of the distribution
+    assert PSWMScanner.score_to_pvalue(
+        [-np.inf, np.inf], pswm_df, strands=[strand, strand],
+        expected_probability=expected_probability, resolution=resolution
+    ).tolist() == pytest.approx([1.0, 0.0])
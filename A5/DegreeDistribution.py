@@ -0,0 +1,263 @@
+# Import Libraries
+import numpy as np  # Computation
+import pandas as pd  # Data Reading
+from scipy import optimize, special, stats  # Likelihood Maximization, Hurwitz Zeta and Normal Distribution
+
+metadata = {
+    'Author      ': 'Jay Annadurai',
+    'Date        ': '17 Oct 2026',
+    'Project     ': 'DegreeDistribution',
+    'Version     ': 1.0,
+    'Description ': "Vectorized Degree Distribution and Power-Law Fitting for Jay Annadurai's Scripts"
+}
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+#  Degree Distribution Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class DegreeDistribution:
+    # Static variable for the fewest degrees above x_min that a candidate x_min may leave to fit the tail
+    min_tail_size = 10
+    # Static variable for the most KS distances evaluated at once during the x_min scan
+    max_scan_cells = 2 ** 22
+    # Static variable for the Newton steps refining the alpha of every candidate x_min on the exact likelihood
+    newton_steps = 10
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Degree Counting Methods       #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def degrees(sources: np.ndarray, targets: np.ndarray, node_count: int = None) -> np.ndarray:
+        """
+        Counts the degree of every node from the int encoded endpoints of the edge records with one bincount.
+        As in the bilateral connections, duplicate records count again and a self-loop counts twice.
+
+        :param sources: The int node ID of the first endpoint of each edge.
+        :param targets: The int node ID of the second endpoint of each edge.
+        :param node_count: The number of nodes. Defaults to one more than the largest node ID.
+        :return: An int array of the degree of each node ID.
+        """
+        endpoints = np.concatenate([np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int64)])
+        return np.bincount(endpoints, minlength=node_count or 0)
+
+    @staticmethod
+    def degree_frequencies(degrees: np.ndarray) -> pd.Series:
+        """
+        Counts the number of nodes with each degree, skipping degrees no node has.
+
+        :param degrees: The degree of each node.
+        :return: A Series of the 'Frequency' of each 'Degree', sorted by degree.
+        """
+        frequencies = np.bincount(np.asarray(degrees, dtype=np.int64))
+        observed = np.flatnonzero(frequencies)
+        return pd.Series(frequencies[observed], index=pd.Index(observed, name='Degree'), name='Frequency')
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Power-Law Fitting Methods     #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def _tail_summary(degrees: np.ndarray) -> tuple:
+        # Returns the distinct positive degrees with their counts, the tail sizes and the tail sums of log degrees
+        values, counts = np.unique(np.asarray(degrees, dtype=np.int64), return_counts=True)
+        counts = counts[values > 0]
+        values = values[values > 0]
+
+        # Suffix sums over the degrees at or above each distinct value
+        tail_sizes = np.cumsum(counts[::-1])[::-1]
+        tail_log_sums = np.cumsum((counts * np.log(values))[::-1])[::-1]
+        return values, counts, tail_sizes, tail_log_sums
+
+    @staticmethod
+    def _power_law_log_likelihood(alpha: float, x_min: int, tail_size: int, tail_log_sum: float) -> float:
+        # Log likelihood of a discrete power law above x_min, normalized by the Hurwitz zeta function
+        return -tail_size * np.log(special.zeta(alpha, x_min)) - alpha * tail_log_sum
+
+    @staticmethod
+    def fit_power_law(degrees: np.ndarray, x_min: int = None) -> dict:
+        """
+        Fits a discrete power law P(k) ~ k^-alpha to the degrees at or above x_min by maximum likelihood.
+
+        Without a given x_min, every distinct degree leaving at least min_tail_size degrees in the tail is tried.
+        The scan is vectorized across the candidates: the approximate discrete MLE of alpha comes from suffix sums
+        and is refined by Newton steps on the exact discrete likelihood. The KS distances between the empirical and
+        fitted tail distributions come from one Hurwitz zeta evaluation per candidate and degree,
+        in blocks of at most max_scan_cells.
+        The x_min with the smallest KS distance is kept and alpha is then refined by the exact discrete MLE.
+
+        :param degrees: The degree of each node. Nodes of degree zero are ignored.
+        :param x_min: The smallest degree of the power-law tail. Defaults to scanning for it.
+        :return: A dict of the fitted 'alpha', its 'alpha_std_err', the 'x_min', the 'tail_size' of degrees fitted,
+            the 'ks' distance of the fit and the 'scan' DataFrame of the 'X_Min', 'Alpha', 'KS' and 'Tail_Size'
+            of every candidate.
+        """
+        values, counts, tail_sizes, tail_log_sums = DegreeDistribution._tail_summary(degrees)
+
+        if x_min is None:
+            candidates = np.flatnonzero(tail_sizes >= DegreeDistribution.min_tail_size)
+            if len(candidates) == 0:
+                candidates = np.array([0])
+        else:
+            candidates = np.flatnonzero(values >= x_min)[:1]
+            if len(candidates) == 0:
+                raise ValueError(f"No degrees at or above x_min {x_min}")
+
+        # Approximate discrete MLE of alpha for every candidate x_min, as the starting point of the refinement
+        candidate_x_mins = values[candidates]
+        candidate_alphas = 1 + tail_sizes[candidates] / (
+            tail_log_sums[candidates] - tail_sizes[candidates] * np.log(candidate_x_mins - 0.5)
+        )
+
+        # The approximation is biased at small x_min, so refine every candidate on the exact likelihood before ranking
+        candidate_alphas = DegreeDistribution._refine_alphas(
+            candidate_alphas, candidate_x_mins, tail_sizes[candidates], tail_log_sums[candidates]
+        )
+
+        # KS distance of each candidate over the distinct degrees of its tail, in blocks of candidates
+        candidate_ks = np.empty(len(candidates))
+        block_size = max(1, DegreeDistribution.max_scan_cells // len(values))
+        for block_start in range(0, len(candidates), block_size):
+            block = slice(block_start, block_start + block_size)
+            candidate_ks[block] = DegreeDistribution._ks_distances(
+                values, tail_sizes, candidates[block], candidate_alphas[block]
+            )
+
+        # Keep the x_min with the closest fit, then maximize the exact likelihood
+        best = int(np.argmin(candidate_ks))
+        best_position = candidates[best]
+        best_x_min = int(values[best_position])
+        tail_size = int(tail_sizes[best_position])
+        tail_log_sum = float(tail_log_sums[best_position])
+
+        alpha = optimize.minimize_scalar(
+            lambda alpha: -DegreeDistribution._power_law_log_likelihood(alpha, best_x_min, tail_size, tail_log_sum),
+            bounds=(1 + 1e-6, candidate_alphas[best] + 5),
+            method='bounded'
+        ).x
+        ks = DegreeDistribution._ks_distances(values, tail_sizes, np.array([best_position]), np.array([alpha]))[0]
+
+        return {
+            'alpha': float(alpha),
+            'alpha_std_err': float((alpha - 1) / np.sqrt(tail_size)),
+            'x_min': best_x_min,
+            'tail_size': tail_size,
+            'ks': float(ks),
+            'scan': pd.DataFrame({
+                'X_Min': candidate_x_mins,
+                'Alpha': candidate_alphas,
+                'KS': candidate_ks,
+                'Tail_Size': tail_sizes[candidates]
+            })
+        }
+
+    @staticmethod
+    def _refine_alphas(
+            alphas: np.ndarray,
+            x_mins: np.ndarray,
+            tail_sizes: np.ndarray,
+            tail_log_sums: np.ndarray
+    ) -> np.ndarray:
+        # Newton steps on the exact discrete log likelihood of every candidate at once
+        # The log Hurwitz zeta is convex in alpha, its derivatives are taken by central differences
+        step = 1e-4
+        alphas = np.asarray(alphas, dtype=float).copy()
+        x_mins = np.asarray(x_mins, dtype=float)
+        mean_logs = tail_log_sums / tail_sizes
+
+        for _ in range(DegreeDistribution.newton_steps):
+            lower = np.log(special.zeta(alphas - step, x_mins))
+            middle = np.log(special.zeta(alphas, x_mins))
+            upper = np.log(special.zeta(alphas + step, x_mins))
+            gradients = (upper - lower) / (2 * step) + mean_logs
+            curvatures = (upper - 2 * middle + lower) / step ** 2
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                updates = np.where(curvatures > 0, gradients / curvatures, 0)
+            # Keep alpha above the pole of the zeta function at 1
+            alphas = np.maximum(alphas - np.clip(np.nan_to_num(updates), -1, 1), 1 + 2 * step)
+
+        return alphas
+
+    @staticmethod
+    def _ks_distances(values: np.ndarray, tail_sizes: np.ndarray, candidates: np.ndarray, alphas: np.ndarray):
+        # Returns the largest gap between the empirical and fitted survival functions above each candidate x_min
+        # Rows are candidates and columns are distinct degrees; degrees below a candidate's x_min are masked out
+        in_tail = np.arange(len(values))[np.newaxis, :] >= candidates[:, np.newaxis]
+        empirical = tail_sizes[np.newaxis, :] / tail_sizes[candidates][:, np.newaxis]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fitted = (
+                special.zeta(alphas[:, np.newaxis], values[np.newaxis, :])
+                / special.zeta(alphas, values[candidates])[:, np.newaxis]
+            )
+
+        return np.where(in_tail, np.abs(empirical - fitted), 0).max(axis=1)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Alternative Comparison Methods #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def _lognormal_log_pmf(values: np.ndarray, x_min: int, mu: float, sigma: float) -> np.ndarray:
+        # Log probability of each degree under a log-normal discretized over [k - 0.5, k + 0.5) and truncated at x_min
+        lower = stats.norm.sf((np.log(values - 0.5) - mu) / sigma)
+        upper = stats.norm.sf((np.log(values + 0.5) - mu) / sigma)
+        tail = stats.norm.sf((np.log(x_min - 0.5) - mu) / sigma)
+        return np.log(np.maximum(lower - upper, np.finfo(float).tiny)) - np.log(np.maximum(tail, np.finfo(float).tiny))
+
+    @staticmethod
+    def compare_lognormal(degrees: np.ndarray, power_law_fit: dict) -> dict:
+        """
+        Compares the power-law fit against a log-normal fitted to the same tail by Vuong's log likelihood ratio test.
+
+        :param degrees: The degree of each node.
+        :param power_law_fit: The result of fit_power_law on the degrees.
+        :return: A dict of the fitted log-normal 'mu' and 'sigma', the 'log_likelihood_ratio' R of the power law
+            over the log-normal, the 'normalized_ratio', the 'p_value' of the sign of R
+            and the 'preferred' distribution ('power_law', 'lognormal' or 'neither' if p >= 0.1).
+        """
+        x_min = power_law_fit['x_min']
+        alpha = power_law_fit['alpha']
+
+        values, counts = np.unique(np.asarray(degrees, dtype=np.int64), return_counts=True)
+        counts = counts[values >= x_min]
+        values = values[values >= x_min]
+        tail_size = counts.sum()
+
+        # Maximum likelihood log-normal over the tail, starting from the moments of the log degrees
+        log_values = np.log(values)
+        mean_log = np.average(log_values, weights=counts)
+        std_log = np.sqrt(np.average((log_values - mean_log) ** 2, weights=counts)) or 1.0
+        mu, log_sigma = optimize.minimize(
+            lambda params: -np.sum(
+                counts * DegreeDistribution._lognormal_log_pmf(values, x_min, params[0], np.exp(params[1]))
+            ),
+            x0=[mean_log, np.log(std_log)],
+            method='Nelder-Mead'
+        ).x
+        sigma = np.exp(log_sigma)
+
+        # Pointwise log likelihood differences of the two fits
+        power_law_log_pmf = -alpha * log_values - np.log(special.zeta(alpha, x_min))
+        differences = power_law_log_pmf - DegreeDistribution._lognormal_log_pmf(values, x_min, mu, sigma)
+
+        log_likelihood_ratio = np.sum(counts * differences)
+        difference_std = np.sqrt(np.average((differences - log_likelihood_ratio / tail_size) ** 2, weights=counts))
+        normalized_ratio = log_likelihood_ratio / (np.sqrt(tail_size) * difference_std) if difference_std > 0 else 0.0
+        p_value = special.erfc(abs(normalized_ratio) / np.sqrt(2))
+
+        if p_value >= 0.1:
+            preferred = 'neither'
+        else:
+            preferred = 'power_law' if log_likelihood_ratio > 0 else 'lognormal'
+
+        return {
+            'mu': float(mu),
+            'sigma': float(sigma),
+            'log_likelihood_ratio': float(log_likelihood_ratio),
+            'normalized_ratio': float(normalized_ratio),
+            'p_value': float(p_value),
+            'preferred': preferred
+        }
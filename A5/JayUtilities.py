@@ -8,9 +8,9 @@ import pandas as pd  # Data Reading
 
 metadata = {
     'Author      ': 'Jay Annadurai',
-    'Date        ': '12 Apr 2024',
+    'Date        ': '17 Oct 2026',
     'Project     ': 'JayUtilities',
-    'Version     ': 1.2,
+    'Version     ': 1.3,
     'Description ': "Contains Utility Functions as used by Jay Annadurai's Scripts"
 }
 
@@ -25,6 +25,8 @@ class DataIO:
     output_folder = 'Output'
     # Supported File Formats
     file_formats = ['txt', 'csv', 'tsv', 'xlsx', 'xls']
+    # Symbols read as a missing endpoint of an edge list
+    edge_list_missing_symbols = ['NA', 'N/A', '#N/A', 'NaN', 'nan', 'NULL', 'null', 'None']
 
     # ~~~~~~~~~~~~~~~~~~~~~ #
     #  File <-> DF Methods  #
@@ -167,6 +169,157 @@ class DataIO:
         else:
             raise ValueError("Unexpected error in saving the file.")
 
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  File -> Edge List Methods   #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def read_edge_list(
+            file_name: str,
+            header_rows: int = 1,
+            drop_self_loops: bool = True,
+            drop_duplicates: bool = True,
+            sort_symbols: bool = True,
+            missing_symbols: list = None,
+            chunk_lines: int = 1_000_000
+    ) -> dict:
+        """
+        Streams a whitespace separated edge list (such as a PPI, BioGRID or STRING dump) from the input directory
+        into int encoded edges, without building any string columns.
+
+        Each line is split on any whitespace, so header and rows may mix spaces and tabs; the first two fields are
+        the endpoints and any further fields are ignored. Symbols are interned to int IDs as they are read,
+        and every chunk of lines is packed into uint64 edge keys (first ID in the high 32 bits)
+        that are sort-uniqued chunk by chunk, so only the distinct edges are ever held in memory.
+        Lines with a missing endpoint symbol are skipped before their symbols are interned.
+        .gz and .bz2 files are read directly.
+
+        :param file_name: The name of the edge list file to be loaded from the input directory.
+        :param header_rows: The number of header lines before the edges.
+        :param drop_self_loops: If True, drops the edges of a symbol to itself.
+        :param drop_duplicates: If True, keeps each undirected edge once with the lower ID first,
+            otherwise keeps every edge record in file order.
+        :param sort_symbols: If True, renumbers the IDs in sorted symbol order, otherwise in order of first appearance.
+        :param missing_symbols: The symbols treated as missing. Defaults to DataIO.edge_list_missing_symbols.
+        :param chunk_lines: The number of lines encoded at a time.
+        :return: A dictionary of the int32 'sources' and 'targets' of the edges, the 'symbols' of the IDs,
+            the 'self_loop_counts' of every ID, the whitespace split header 'columns',
+            and the counts of 'records' read, 'skipped_lines', 'self_loops' and 'duplicates' dropped.
+        """
+        if missing_symbols is None:
+            missing_symbols = DataIO.edge_list_missing_symbols
+        missing_symbols = set(missing_symbols)
+
+        file_path = os.path.join(DataIO.input_folder, file_name)
+
+        # Decompress by the file extension
+        if file_name.endswith('.gz'):
+            open_func = gzip.open
+        elif file_name.endswith('.bz2'):
+            open_func = bz2.open
+        else:
+            open_func = open
+
+        symbol_ids = {}
+        edge_key_chunks = []
+        kept_edges = 0
+        self_loop_ids = []
+        columns = []
+        records = 0
+        skipped_lines = 0
+
+        def encode_chunk(chunk_sources, chunk_targets):
+            # Packs a chunk of endpoint IDs into uint64 edge keys, dropping self-loops and duplicates
+            nonlocal edge_key_chunks, kept_edges
+            chunk_sources = np.asarray(chunk_sources, dtype=np.uint64)
+            chunk_targets = np.asarray(chunk_targets, dtype=np.uint64)
+
+            is_self_loop = chunk_sources == chunk_targets
+            self_loop_ids.append(chunk_sources[is_self_loop])
+            if drop_self_loops:
+                chunk_sources = chunk_sources[~is_self_loop]
+                chunk_targets = chunk_targets[~is_self_loop]
+
+            if drop_duplicates:
+                chunk_keys = np.unique(
+                    (np.minimum(chunk_sources, chunk_targets) << np.uint64(32))
+                    | np.maximum(chunk_sources, chunk_targets)
+                )
+            else:
+                chunk_keys = (chunk_sources << np.uint64(32)) | chunk_targets
+
+            edge_key_chunks.append(chunk_keys)
+            kept_edges += len(chunk_keys)
+
+            # Merge the distinct edges once the chunks hold as many keys again
+            if drop_duplicates and len(edge_key_chunks) > 1 and kept_edges > 2 * len(edge_key_chunks[0]):
+                edge_key_chunks = [np.unique(np.concatenate(edge_key_chunks))]
+                kept_edges = len(edge_key_chunks[0])
+
+        with open_func(file_path, 'rt') as edge_file:
+            # Split the header on any whitespace, repairing space separated column names
+            for _ in range(header_rows):
+                columns = edge_file.readline().split()
+
+            chunk_sources = []
+            chunk_targets = []
+            for line in edge_file:
+                fields = line.split()
+
+                # Skip blank, truncated or missing endpoint lines
+                if len(fields) < 2 or fields[0] in missing_symbols or fields[1] in missing_symbols:
+                    skipped_lines += len(fields) > 0
+                    continue
+
+                # Intern the endpoint symbols as the next free ID on first sight
+                chunk_sources.append(symbol_ids.setdefault(fields[0], len(symbol_ids)))
+                chunk_targets.append(symbol_ids.setdefault(fields[1], len(symbol_ids)))
+                records += 1
+
+                if len(chunk_sources) >= chunk_lines:
+                    encode_chunk(chunk_sources, chunk_targets)
+                    chunk_sources = []
+                    chunk_targets = []
+
+            encode_chunk(chunk_sources, chunk_targets)
+
+        # Unpack the distinct edges
+        edge_keys = np.concatenate(edge_key_chunks)
+        if drop_duplicates:
+            edge_keys = np.unique(edge_keys)
+        sources = (edge_keys >> np.uint64(32)).astype(np.int32)
+        targets = (edge_keys & np.uint64(0xFFFFFFFF)).astype(np.int32)
+
+        symbols = np.array(list(symbol_ids), dtype=object)
+        self_loop_ids = np.concatenate(self_loop_ids).astype(np.int64)
+
+        # Renumber the IDs in sorted symbol order, keeping the lower ID first for the distinct edges
+        if sort_symbols:
+            symbol_order = np.argsort(symbols)
+            new_ids = np.empty(len(symbols), dtype=np.int32)
+            new_ids[symbol_order] = np.arange(len(symbols), dtype=np.int32)
+            symbols = symbols[symbol_order]
+            sources, targets = new_ids[sources], new_ids[targets]
+            self_loop_ids = new_ids[self_loop_ids]
+
+            if drop_duplicates:
+                sources, targets = np.minimum(sources, targets), np.maximum(sources, targets)
+                edge_order = np.lexsort((targets, sources))
+                sources, targets = sources[edge_order], targets[edge_order]
+
+        self_loop_count = len(self_loop_ids) if drop_self_loops else 0
+        return {
+            'sources': sources,
+            'targets': targets,
+            'symbols': symbols,
+            'self_loop_counts': np.bincount(self_loop_ids, minlength=len(symbols)).astype(np.int32),
+            'columns': columns,
+            'records': records,
+            'skipped_lines': skipped_lines,
+            'self_loops': self_loop_count,
+            'duplicates': records - self_loop_count - len(sources)
+        }
+
     # ~~~~~~~~~~~~~~~~~~~~~~ #
     #  File <-> Zip Methods  #
     # ~~~~~~~~~~~~~~~~~~~~~~ #
@@ -0,0 +1,240 @@
+# Import Libraries
+from concurrent.futures import ProcessPoolExecutor  # Parallel Replicates across Processes
+import numpy as np  # Computation
+import pandas as pd  # Data Reading
+from PPINetwork import PPINetwork  # Sparse PPI Network Graph Class
+
+metadata = {
+    'Author      ': 'Jay Annadurai',
+    'Date        ': '17 Oct 2026',
+    'Project     ': 'NullModel',
+    'Version     ': 1.0,
+    'Description ': "Degree-Preserving Randomized PPI Network Null Models for Jay Annadurai's Scripts"
+}
+
+# ~~~~~~~~~~~~~~~~~~~~~
+#  Null Model Class
+# ~~~~~~~~~~~~~~~~~~~~~
+
+
+class NullModel:
+    # Static variable for the number of successful edge swaps per edge of a randomized replicate
+    swaps_per_edge = 10
+    # Static variable for the number of swap rounds in a row without any accepted swap before giving up
+    max_stalled_rounds = 10
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Edge Swap Methods             #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def _edge_keys(sources: np.ndarray, targets: np.ndarray, node_count: int) -> np.ndarray:
+        # Packs each undirected edge into one int64 key with the lower node ID first
+        return np.minimum(sources, targets) * node_count + np.maximum(sources, targets)
+
+    @staticmethod
+    def degree_preserving_swaps(
+            sources: np.ndarray,
+            targets: np.ndarray,
+            node_count: int,
+            swaps_per_edge: int = None,
+            rng: np.random.Generator = None
+    ) -> tuple:
+        """
+        Randomizes a simple undirected graph while keeping the degree of every node, by double edge swaps
+        (a - b, c - d becomes a - d, c - b) run in rounds over the int encoded edge arrays.
+
+        Every round pairs up disjoint random edges, orients each pair at random, and rejects in bulk any swap that
+        would create a self-loop or an edge already in the graph (binary search in the sorted edge keys)
+        or made by another swap of the same round.
+
+        :param sources: The int node ID of the first endpoint of each distinct edge, without self-loops.
+        :param targets: The int node ID of the second endpoint of each distinct edge, without self-loops.
+        :param node_count: The number of nodes.
+        :param swaps_per_edge: The number of accepted swaps per edge. Defaults to the static swaps_per_edge.
+        :param rng: The random generator. Defaults to a freshly seeded generator.
+        :return: A tuple of the randomized int64 source and target arrays.
+        """
+        if swaps_per_edge is None:
+            swaps_per_edge = NullModel.swaps_per_edge
+        if rng is None:
+            rng = np.random.default_rng()
+
+        sources = np.array(sources, dtype=np.int64)
+        targets = np.array(targets, dtype=np.int64)
+        edge_count = len(sources)
+        if edge_count < 2:
+            return sources, targets
+
+        edge_keys = np.sort(NullModel._edge_keys(sources, targets, node_count))
+        remaining_swaps = swaps_per_edge * edge_count
+        stalled_rounds = 0
+
+        while remaining_swaps > 0 and stalled_rounds < NullModel.max_stalled_rounds:
+            # Pair up disjoint random edges
+            pair_count = min(edge_count // 2, remaining_swaps)
+            shuffled = rng.permutation(edge_count)[:2 * pair_count]
+            firsts, seconds = shuffled[:pair_count], shuffled[pair_count:]
+
+            # Orient the second edge of each pair at random so both swap patterns are drawn
+            flip = rng.random(pair_count) < 0.5
+            a, b = sources[firsts], targets[firsts]
+            c = np.where(flip, targets[seconds], sources[seconds])
+            d = np.where(flip, sources[seconds], targets[seconds])
+
+            # Reject swaps creating self-loops or edges already in the graph
+            new_keys_one = NullModel._edge_keys(a, d, node_count)
+            new_keys_two = NullModel._edge_keys(c, b, node_count)
+            accepted = (a != d) & (c != b) & (new_keys_one != new_keys_two)
+            for new_keys in [new_keys_one, new_keys_two]:
+                key_positions = np.minimum(np.searchsorted(edge_keys, new_keys), edge_count - 1)
+                accepted &= edge_keys[key_positions] != new_keys
+
+            # Reject swaps creating the same edge as another swap of the round
+            round_keys = np.concatenate([new_keys_one[accepted], new_keys_two[accepted]])
+            _, key_inverse, key_counts = np.unique(round_keys, return_inverse=True, return_counts=True)
+            duplicated = (key_counts[key_inverse] > 1).reshape(2, -1).any(axis=0)
+            accepted[np.flatnonzero(accepted)[duplicated]] = False
+
+            # Apply the accepted swaps
+            targets[firsts[accepted]] = d[accepted]
+            sources[seconds[accepted]] = c[accepted]
+            targets[seconds[accepted]] = b[accepted]
+            edge_keys = np.sort(NullModel._edge_keys(sources, targets, node_count))
+
+            accepted_count = int(accepted.sum())
+            remaining_swaps -= accepted_count
+            stalled_rounds = 0 if accepted_count > 0 else stalled_rounds + 1
+
+        return sources, targets
+
+    @staticmethod
+    def randomized_network(network: PPINetwork, swaps_per_edge: int = None, seed=None) -> PPINetwork:
+        """
+        Builds a degree-preserving randomized copy of a network. Self-loops are kept on their nodes.
+
+        :param network: The network to randomize.
+        :param swaps_per_edge: The number of accepted swaps per edge. Defaults to the static swaps_per_edge.
+        :param seed: The seed of the random generator.
+        :return: A randomized PPINetwork with the same symbols and degrees.
+        """
+        sources, targets = network.edges()
+        sources, targets = NullModel.degree_preserving_swaps(
+            sources, targets, network.node_count, swaps_per_edge, np.random.default_rng(seed)
+        )
+        randomized = PPINetwork.from_edges(sources, targets, symbols=network.symbols)
+        randomized.self_loop_counts = network.self_loop_counts.copy()
+        return randomized
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Null Model Statistics Methods #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def network_statistics(network: PPINetwork, protein_lists: dict = None) -> dict:
+        """
+        Computes the statistics compared against the null model.
+
+        :param network: The network.
+        :param protein_lists: A dict of the protein lists to compute path length statistics for, by list name.
+        :return: A dict of the 'Average_Clustering' and, per list, the '{name}_Mean_Path_Length'
+            of the connected pairs of proteins in the list.
+        """
+        statistics = {'Average_Clustering': network.local_clustering()['clustering_coef'].mean()}
+
+        for list_name, protein_list in (protein_lists or {}).items():
+            # Path lengths of each unique pair of the list, skipping unreachable and missing proteins
+            distances = network.distance_matrix(protein_list)
+            pair_lengths = distances[np.triu_indices(len(distances), k=1)]
+            pair_lengths = pair_lengths[pair_lengths >= 0]
+
+            statistics[f"{list_name}_Mean_Path_Length"] = pair_lengths.mean() if len(pair_lengths) else np.nan
+
+        return statistics
+
+    @staticmethod
+    def replicate_statistics(
+            sources: np.ndarray,
+            targets: np.ndarray,
+            symbols: np.ndarray,
+            self_loop_counts: np.ndarray,
+            protein_lists: dict,
+            swaps_per_edge: int,
+            seed
+    ) -> dict:
+        """
+        Randomizes the network given by its edge arrays and computes its statistics, as run by each worker.
+
+        :param sources: The int node ID of the first endpoint of each distinct edge, without self-loops.
+        :param targets: The int node ID of the second endpoint of each distinct edge, without self-loops.
+        :param symbols: The protein symbol of each node ID.
+        :param self_loop_counts: The number of self-interaction records of each node.
+        :param protein_lists: A dict of the protein lists to compute path length statistics for, by list name.
+        :param swaps_per_edge: The number of accepted swaps per edge.
+        :param seed: The seed of the random generator of this replicate.
+        :return: The network_statistics of the randomized network.
+        """
+        network = PPINetwork.from_edges(sources, targets, symbols=symbols)
+        network.self_loop_counts = self_loop_counts
+        return NullModel.network_statistics(
+            NullModel.randomized_network(network, swaps_per_edge, seed), protein_lists
+        )
+
+    @staticmethod
+    def null_model_z_scores(
+            network: PPINetwork,
+            protein_lists: dict = None,
+            replicates: int = 100,
+            swaps_per_edge: int = None,
+            max_workers: int = None,
+            seed: int = None
+    ) -> dict:
+        """
+        Compares the statistics of a network against R degree-preserving randomized replicates built across a
+        process pool, as z-scores of the observed statistics within the replicate distributions.
+
+        :param network: The network.
+        :param protein_lists: A dict of the protein lists to compute path length statistics for, by list name.
+        :param replicates: The number R of randomized replicates.
+        :param swaps_per_edge: The number of accepted swaps per edge. Defaults to the static swaps_per_edge.
+        :param max_workers: The number of worker processes. Defaults to the CPU count.
+        :param seed: The seed the independent replicate seeds are spawned from.
+        :return: A dict of the 'summary' DataFrame of the 'Statistic', 'Observed', 'Null_Mean', 'Null_Std' and
+            'Z_Score' of each statistic, and the 'replicates' DataFrame of the statistics of every replicate.
+        """
+        if swaps_per_edge is None:
+            swaps_per_edge = NullModel.swaps_per_edge
+        protein_lists = {
+            list_name: list(np.asarray(protein_list, dtype=object))
+            for list_name, protein_list in (protein_lists or {}).items()
+        }
+
+        observed = NullModel.network_statistics(network, protein_lists)
+
+        # Independent random streams per replicate
+        replicate_seeds = np.random.SeedSequence(seed).spawn(replicates)
+        sources, targets = network.edges()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    NullModel.replicate_statistics, sources, targets, network.symbols, network.self_loop_counts,
+                    protein_lists, swaps_per_edge, replicate_seed
+                )
+                for replicate_seed in replicate_seeds
+            ]
+            replicates_df = pd.DataFrame([future.result() for future in futures], columns=list(observed))
+
+        null_means = replicates_df.mean()
+        null_stds = replicates_df.std(ddof=1)
+        observed = pd.Series(observed)
+
+        summary = pd.DataFrame({
+            'Statistic': observed.index,
+            'Observed': observed.to_numpy(dtype=float),
+            'Null_Mean': null_means.to_numpy(),
+            'Null_Std': null_stds.to_numpy(),
+            'Z_Score': ((observed - null_means) / null_stds.where(null_stds > 0)).to_numpy()
+        })
+
+        return {'summary': summary, 'replicates': replicates_df}
@@ -0,0 +1,937 @@
+# Import Libraries
+import os  # File Paths
+import json  # Serialized Cache Keys
+import hashlib  # Content Hashes of Source Files
+from concurrent.futures import ProcessPoolExecutor  # Parallel Source Chunks across Processes
+import numpy as np  # Computation
+import pandas as pd  # Data Reading
+from scipy import sparse  # Sparse Adjacency Matrices
+from scipy.sparse import csgraph  # Sparse Graph Algorithms
+from scipy import stats  # Normal Distribution
+from JayUtilities import DataIO as Jio  # Data Input/Output Processing Utility Class
+
+metadata = {
+    'Author      ': 'Jay Annadurai',
+    'Date        ': '17 Oct 2026',
+    'Project     ': 'PPINetwork',
+    'Version     ': 1.0,
+    'Description ': "Sparse Protein-Protein Interaction Network Core for Jay Annadurai's Scripts"
+}
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+#  PPI Network Graph Class
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+
+class PPINetwork:
+    """
+    Undirected protein-protein interaction network stored as a sparse CSR adjacency matrix.
+
+    Protein symbols are mapped once to int32 node IDs in sorted symbol order.
+    The adjacency holds every distinct neighbour of a node (self-loops excluded) in sorted order,
+    with the number of interaction records between the two proteins as the value.
+    Self-loops are tracked separately by a per-node count, so the neighbours of a node never include itself.
+    """
+
+    # Sentinel path lengths of protein pairs in different components, and of proteins missing from the network
+    unreachable_distance = -1
+    missing_distance = -2
+    # Array files of a saved network and of its cached edge list, memory-mapped on load
+    network_arrays = ['indptr', 'indices', 'data']
+    edge_list_arrays = ['sources', 'targets']
+    # Most cells of the dense per-source distance, path count and dependency arrays of one centrality BFS batch
+    max_centrality_cells = 2 ** 20
+
+    def __init__(self, symbols: np.ndarray, adjacency: sparse.csr_matrix, self_loop_counts: np.ndarray = None):
+        """
+        Wraps an existing symbol table and symmetric adjacency matrix.
+
+        :param symbols: The protein symbol of each node ID.
+        :param adjacency: The symmetric CSR adjacency matrix of interaction record counts, without a diagonal.
+        :param self_loop_counts: The number of self-interaction records of each node. Defaults to none.
+        """
+        self.symbols = np.asarray(symbols, dtype=object)
+        self.adjacency = adjacency
+        self.adjacency.sort_indices()
+
+        if self_loop_counts is None:
+            self_loop_counts = np.zeros(len(self.symbols), dtype=np.int32)
+        self.self_loop_counts = np.asarray(self_loop_counts, dtype=np.int32)
+
+        # Lookup of the node ID of each symbol
+        self.symbol_index = pd.Index(self.symbols)
+
+        # Connected component of each node, labelled on first use
+        self._component_labels = None
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Network Construction Methods  #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @classmethod
+    def from_edges(cls, sources: np.ndarray, targets: np.ndarray, symbols: np.ndarray = None) -> 'PPINetwork':
+        """
+        Builds the network from the two endpoint arrays of the interaction records.
+
+        :param sources: The first protein of each interaction, as symbols or as int node IDs if symbols is given.
+        :param targets: The second protein of each interaction, as symbols or as int node IDs if symbols is given.
+        :param symbols: Optionally, the symbol table of already int encoded endpoints.
+        :return: A PPINetwork of the interactions.
+        """
+        if symbols is None:
+            # Intern the symbols of both endpoints at once into IDs in sorted symbol order
+            codes, symbols = pd.factorize(
+                np.concatenate([np.asarray(sources, dtype=object), np.asarray(targets, dtype=object)]),
+                sort=True
+            )
+            sources, targets = np.split(codes.astype(np.int32), 2)
+            symbols = np.asarray(symbols, dtype=object)
+        else:
+            sources = np.asarray(sources, dtype=np.int32)
+            targets = np.asarray(targets, dtype=np.int32)
+
+        node_count = len(symbols)
+
+        # Self-loops are counted per node rather than stored on the diagonal
+        is_self_loop = sources == targets
+        self_loop_counts = np.bincount(sources[is_self_loop], minlength=node_count).astype(np.int32)
+
+        # Store each interaction in both directions; duplicates are summed into record counts
+        sources = sources[~is_self_loop]
+        targets = targets[~is_self_loop]
+        adjacency = sparse.csr_matrix(
+            (
+                np.ones(2 * len(sources), dtype=np.int32),
+                (np.concatenate([sources, targets]), np.concatenate([targets, sources]))
+            ),
+            shape=(node_count, node_count)
+        )
+        adjacency.sum_duplicates()
+
+        return cls(symbols, adjacency, self_loop_counts)
+
+    @classmethod
+    def from_edge_df(cls, network_df: pd.DataFrame, col_start_node: str, col_end_node: str) -> 'PPINetwork':
+        """
+        Builds the network from an edge DataFrame of protein symbols. Edges missing either symbol are dropped.
+
+        :param network_df: The DataFrame of interactions.
+        :param col_start_node: The column of the first protein of each interaction.
+        :param col_end_node: The column of the second protein of each interaction.
+        :return: A PPINetwork of the interactions.
+        """
+        network_df = network_df[[col_start_node, col_end_node]].dropna()
+        return cls.from_edges(network_df[col_start_node].to_numpy(), network_df[col_end_node].to_numpy())
+
+    @classmethod
+    def from_edge_list(cls, edge_list: dict) -> 'PPINetwork':
+        """
+        Builds the network from the int encoded edges of an edge list file as read by DataIO.read_edge_list.
+        The self-loops dropped by the reader are kept as the self-loop counts of their nodes.
+
+        :param edge_list: The dictionary returned by DataIO.read_edge_list.
+        :return: A PPINetwork of the edges.
+        """
+        network = cls.from_edges(edge_list['sources'], edge_list['targets'], symbols=edge_list['symbols'])
+        if edge_list['self_loops'] > 0:
+            network.self_loop_counts = np.asarray(edge_list['self_loop_counts'], dtype=np.int32)
+        return network
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Network Store Methods         #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    def save(self, store_name: str, folder: str = None) -> None:
+        """
+        Saves the network as a binary store: a .npy file per CSR array ('{store_name}.indptr.npy', '.indices.npy'
+        and '.data.npy') and an index of the symbols and self-loop counts ('{store_name}.index.npz').
+
+        :param store_name: The name of the store without the extension.
+        :param folder: The folder to save the store in. Defaults to the output folder.
+        :return: None
+        """
+        if folder is None:
+            folder = Jio.output_folder
+
+        store_path = os.path.join(folder, store_name)
+
+        for array_name in PPINetwork.network_arrays:
+            np.save(f"{store_path}.{array_name}.npy", getattr(self.adjacency, array_name))
+
+        np.savez(
+            f"{store_path}.index.npz",
+            symbols=self.symbols.astype(str),
+            self_loop_counts=self.self_loop_counts
+        )
+
+    @classmethod
+    def load(cls, store_name: str, folder: str = None) -> 'PPINetwork':
+        """
+        Opens a network store saved by save. The CSR arrays are memory-mapped read-only,
+        so opening is near instant regardless of the network size.
+
+        :param store_name: The name of the store without the extension.
+        :param folder: The folder to load the store from. Defaults to the input folder.
+        :return: The PPINetwork of the store.
+        """
+        if folder is None:
+            folder = Jio.input_folder
+
+        store_path = os.path.join(folder, store_name)
+
+        with np.load(f"{store_path}.index.npz") as index:
+            symbols = index['symbols'].astype(object)
+            self_loop_counts = index['self_loop_counts']
+
+        indptr, indices, data = [
+            np.load(f"{store_path}.{array_name}.npy", mmap_mode='r') for array_name in PPINetwork.network_arrays
+        ]
+        adjacency = sparse.csr_matrix((data, indices, indptr), shape=(len(symbols), len(symbols)), copy=False)
+        return cls(symbols, adjacency, self_loop_counts)
+
+    @staticmethod
+    def file_hash(file_path: str, block_size: int = 2 ** 24) -> str:
+        """
+        :return: The SHA-256 hex digest of the contents of a file, read in blocks.
+        """
+        file_hash = hashlib.sha256()
+        with open(file_path, 'rb') as source_file:
+            for block in iter(lambda: source_file.read(block_size), b''):
+                file_hash.update(block)
+        return file_hash.hexdigest()
+
+    @classmethod
+    def read_edge_list_cached(cls, file_name: str, cache_folder: str = None, **read_args) -> dict:
+        """
+        Reads an edge list file from the input directory into a network through a binary cache.
+
+        The cache holds the network store (see save) and the int encoded edges of the edge list,
+        keyed by the size, modification time and SHA-256 content hash of the source file and the read arguments.
+        An unchanged file is loaded from the memory-mapped cache without being read.
+        A file with a new modification time but the same size is hashed, and reused if its contents are unchanged.
+        Any other change rebuilds the cache from the file.
+
+        :param file_name: The name of the edge list file to be loaded from the input directory.
+        :param cache_folder: The folder to keep the cache in. Defaults to the output folder. Created if missing.
+        :param read_args: Arguments passed on to DataIO.read_edge_list.
+        :return: A dictionary of the 'network', the 'edge_list' as returned by DataIO.read_edge_list
+            (with memory-mapped edges on a cache hit) and whether it was 'cached'.
+        """
+        if cache_folder is None:
+            cache_folder = Jio.output_folder
+        os.makedirs(cache_folder, exist_ok=True)
+
+        source_path = os.path.join(Jio.input_folder, file_name)
+        store_name = f"{os.path.basename(file_name)}.graph"
+        store_path = os.path.join(cache_folder, store_name)
+        key_path = f"{store_path}.key.json"
+
+        source_stat = os.stat(source_path)
+        source_key = {
+            'size': source_stat.st_size,
+            'mtime_ns': source_stat.st_mtime_ns,
+            'read_args': json.dumps(read_args, sort_keys=True)
+        }
+
+        # Compare against the key of the cached file, hashing the source only if its modification time moved
+        cached_key = None
+        if os.path.exists(key_path):
+            with open(key_path) as key_file:
+                cached_key = json.load(key_file)
+
+        cached = False
+        if cached_key is not None and all(
+                cached_key.get(key_name) == source_key[key_name] for key_name in ['size', 'read_args']
+        ):
+            if cached_key.get('mtime_ns') == source_key['mtime_ns']:
+                cached = True
+            else:
+                source_key['sha256'] = cls.file_hash(source_path)
+                cached = cached_key.get('sha256') == source_key['sha256']
+
+        if cached:
+            network = cls.load(store_name, cache_folder)
+            with np.load(f"{store_path}.edges.npz") as edge_index:
+                edge_list = {key_name: edge_index[key_name] for key_name in edge_index.files}
+            for array_name in PPINetwork.edge_list_arrays:
+                edge_list[array_name] = np.load(f"{store_path}.{array_name}.npy", mmap_mode='r')
+            edge_list['symbols'] = network.symbols
+            edge_list['columns'] = [str(column) for column in edge_list['columns']]
+            for count_name in ['records', 'skipped_lines', 'self_loops', 'duplicates']:
+                edge_list[count_name] = int(edge_list[count_name])
+
+            # Record the new modification time of unchanged contents
+            if cached_key['mtime_ns'] != source_key['mtime_ns']:
+                cached_key['mtime_ns'] = source_key['mtime_ns']
+                with open(key_path, 'w') as key_file:
+                    json.dump(cached_key, key_file)
+
+            return {'network': network, 'edge_list': edge_list, 'cached': True}
+
+        # Rebuild the cache from the source file, writing the key last once the store is complete
+        if os.path.exists(key_path):
+            os.remove(key_path)
+
+        edge_list = Jio.read_edge_list(file_name, **read_args)
+        network = cls.from_edge_list(edge_list)
+        network.save(store_name, cache_folder)
+
+        for array_name in PPINetwork.edge_list_arrays:
+            np.save(f"{store_path}.{array_name}.npy", edge_list[array_name])
+        np.savez(
+            f"{store_path}.edges.npz",
+            **{
+                key_name: value for key_name, value in edge_list.items()
+                if key_name not in PPINetwork.edge_list_arrays + ['symbols']
+            }
+        )
+
+        source_key.setdefault('sha256', cls.file_hash(source_path))
+        with open(key_path, 'w') as key_file:
+            json.dump(source_key, key_file)
+
+        return {'network': network, 'edge_list': edge_list, 'cached': False}
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Node and Edge Lookup Methods  #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @property
+    def node_count(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def edge_count(self) -> int:
+        # Distinct undirected edges, excluding self-loops
+        return self.adjacency.nnz // 2
+
+    @property
+    def self_loops(self) -> np.ndarray:
+        # Boolean mask of the nodes interacting with themselves
+        return self.self_loop_counts > 0
+
+    def node_ids(self, symbols) -> np.ndarray:
+        """
+        Maps protein symbols to their node IDs.
+
+        :param symbols: A symbol or a list of symbols.
+        :return: An int32 array of node IDs, -1 for symbols not in the network.
+        """
+        return self.symbol_index.get_indexer(np.atleast_1d(np.asarray(symbols, dtype=object))).astype(np.int32)
+
+    def degrees(self) -> np.ndarray:
+        """
+        The number of distinct neighbours of every node, excluding itself, in O(1) per node from the CSR offsets.
+
+        :return: An int array of the degree of each node ID.
+        """
+        return np.diff(self.adjacency.indptr)
+
+    def neighbors(self, node: int | str) -> np.ndarray:
+        """
+        The sorted neighbour IDs of a node, excluding itself, as a view of the CSR indices in O(deg).
+
+        :param node: The node ID or symbol.
+        :return: An int array of neighbour node IDs.
+        """
+        if isinstance(node, str):
+            node = self.node_ids(node)[0]
+        return self.adjacency.indices[self.adjacency.indptr[node]:self.adjacency.indptr[node + 1]]
+
+    def has_edge(self, node_one: int | str, node_two: int | str) -> bool:
+        """
+        Checks for an interaction between two nodes by binary search in the sorted neighbours of the first.
+
+        :param node_one: The first node ID or symbol.
+        :param node_two: The second node ID or symbol.
+        :return: True if the nodes interact.
+        """
+        if isinstance(node_one, str):
+            node_one = self.node_ids(node_one)[0]
+        if isinstance(node_two, str):
+            node_two = self.node_ids(node_two)[0]
+        if node_one < 0 or node_two < 0:
+            return False
+        if node_one == node_two:
+            return bool(self.self_loop_counts[node_one] > 0)
+
+        neighbors = self.neighbors(node_one)
+        position = np.searchsorted(neighbors, node_two)
+        return bool(position < len(neighbors) and neighbors[position] == node_two)
+
+    def edges(self) -> tuple:
+        """
+        The distinct undirected edges, excluding self-loops, each once with the lower node ID first.
+
+        :return: A tuple of the int32 source and target arrays.
+        """
+        upper = sparse.triu(self.adjacency, k=1).tocoo()
+        return upper.row.astype(np.int32), upper.col.astype(np.int32)
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Degree Methods                #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    def connection_counts(self) -> np.ndarray:
+        """
+        The number of interaction records of every node as in the bilateral connections of the edge DataFrame:
+        duplicate records are counted again, and a self-interaction counts twice, once per endpoint.
+
+        :return: An int array of the connection count of each node ID.
+        """
+        return np.asarray(self.adjacency.sum(axis=1)).ravel() + 2 * self.self_loop_counts
+
+    def degree_series(self, connection_counts: bool = True) -> pd.Series:
+        """
+        The degree of every node as a Series indexed by protein symbol, sorted from the highest degree.
+
+        :param connection_counts: If True, counts interaction records as connection_counts does,
+            otherwise counts distinct neighbours as degrees does.
+        :return: A Series named 'Connections_Count' indexed by 'Node'.
+        """
+        values = self.connection_counts() if connection_counts else self.degrees()
+        degree_series = pd.Series(values, index=pd.Index(self.symbols, name='Node'), name='Connections_Count')
+        return degree_series.sort_values(ascending=False, kind='stable')
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Clustering Methods            #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def _row_pairs(indptr: np.ndarray, row_start: int, row_end: int) -> tuple:
+        # Returns every pair of positions (i < j) within the same row of a CSR matrix for a block of rows
+        first_positions = np.arange(indptr[row_start], indptr[row_end])
+        row_ends = np.repeat(indptr[row_start + 1:row_end + 1], np.diff(indptr[row_start:row_end + 1]))
+        pair_counts = row_ends - first_positions - 1
+
+        firsts = np.repeat(first_positions, pair_counts)
+        pair_offsets = np.arange(pair_counts.sum()) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+        return firsts, firsts + 1 + pair_offsets
+
+    def triangle_counts(self, max_wedges: int = 2 ** 24) -> np.ndarray:
+        """
+        Counts the triangles through every node at once by sorted neighbour intersection.
+
+        Every edge is oriented from the lower to the higher degree node, which bounds the out-degree of every node
+        by the square root of twice the edge count, so the hubs never enumerate their neighbourhoods.
+        Each triangle is then found exactly once as a pair of out-neighbours of its lowest ranked node
+        that are themselves joined by an edge, checked by binary search in the sorted oriented edge keys.
+
+        :param max_wedges: The maximum number of neighbour pairs checked at once, bounding the memory used.
+        :return: An int64 array of the number of triangles through each node ID.
+        """
+        node_count = self.node_count
+        triangles = np.zeros(node_count, dtype=np.int64)
+
+        # Rank the nodes by degree, then relabel them so the oriented edges point to higher ranks
+        rank_order = np.lexsort((np.arange(node_count), self.degrees()))
+        ranks = np.empty(node_count, dtype=np.int64)
+        ranks[rank_order] = np.arange(node_count)
+
+        sources, targets = self.edges()
+        sources, targets = ranks[sources], ranks[targets]
+        low, high = np.minimum(sources, targets), np.maximum(sources, targets)
+        oriented = sparse.csr_matrix(
+            (np.ones(len(low), dtype=np.int8), (low, high)), shape=(node_count, node_count)
+        )
+        oriented.sort_indices()
+
+        # Row-major keys of the oriented edges are already sorted
+        oriented_rows = np.repeat(np.arange(node_count, dtype=np.int64), np.diff(oriented.indptr))
+        edge_keys = oriented_rows * node_count + oriented.indices
+
+        # Split the rows into blocks of at most max_wedges neighbour pairs
+        out_degrees = np.diff(oriented.indptr).astype(np.int64)
+        cumulative_wedges = np.cumsum(out_degrees * (out_degrees - 1) // 2)
+        block_ends = np.unique(np.append(
+            np.searchsorted(cumulative_wedges, np.arange(max_wedges, cumulative_wedges[-1], max_wedges)) + 1,
+            node_count
+        )) if node_count > 0 else []
+
+        row_start = 0
+        for row_end in block_ends:
+            firsts, seconds = self._row_pairs(oriented.indptr, row_start, row_end)
+
+            # A pair of out-neighbours closes a triangle if the lower ranked one points to the other
+            closing_keys = oriented.indices[firsts].astype(np.int64) * node_count + oriented.indices[seconds]
+            key_positions = np.minimum(np.searchsorted(edge_keys, closing_keys), max(len(edge_keys) - 1, 0))
+            closed = edge_keys[key_positions] == closing_keys if len(edge_keys) else np.zeros(0, dtype=bool)
+
+            # Credit each of the three nodes of the triangle
+            triangles += np.bincount(oriented_rows[firsts[closed]], minlength=node_count)
+            triangles += np.bincount(oriented.indices[firsts[closed]], minlength=node_count)
+            triangles += np.bincount(oriented.indices[seconds[closed]], minlength=node_count)
+            row_start = row_end
+
+        # Map the ranks back to node IDs
+        return triangles[ranks]
+
+    def local_clustering(self, count_self_loops: bool = True) -> pd.DataFrame:
+        """
+        Computes the local clustering coefficient of every node from its triangle count.
+
+        :param count_self_loops: If True, a node interacting with itself counts itself as one of its neighbours
+            as in the original per node groupby of the bilateral connections. If False, neighbours exclude the node
+            as in networkx.clustering.
+        :return: A DataFrame indexed by 'Node' with the 'neighbor_count', 'bi_links', 'links', 'possible_links'
+            and 'clustering_coef' of each node.
+        """
+        triangles = self.triangle_counts()
+
+        neighbor_count = self.degrees().astype(np.int64)
+        if count_self_loops:
+            neighbor_count = neighbor_count + self.self_loops
+
+        # Every link between two neighbours closes a triangle and appears once per direction in the connections
+        possible_links = neighbor_count * (neighbor_count - 1) / 2
+        clustering_coef = np.divide(
+            triangles, possible_links, out=np.zeros(self.node_count), where=possible_links > 0
+        )
+
+        return pd.DataFrame({
+            'neighbor_count': neighbor_count,
+            'bi_links': 2 * triangles,
+            'links': triangles.astype(float),
+            'possible_links': possible_links,
+            'clustering_coef': clustering_coef
+        }, index=pd.Index(self.symbols, name='Node'))
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Connected Component Methods   #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    def component_labels(self) -> np.ndarray:
+        """
+        Labels the connected component of every node once, so reachability is answered in O(1) before any search.
+
+        :return: An int32 array of the component label of each node ID.
+        """
+        if self._component_labels is None:
+            _, labels = csgraph.connected_components(self.adjacency, directed=False)
+            self._component_labels = labels.astype(np.int32)
+        return self._component_labels
+
+    def component_sizes(self) -> np.ndarray:
+        """
+        :return: An int array of the number of nodes in each component label.
+        """
+        return np.bincount(self.component_labels())
+
+    def connected(self, node_one: int | str, node_two: int | str) -> bool:
+        """
+        Checks whether any path joins two nodes by comparing their component labels.
+
+        :param node_one: The first node ID or symbol.
+        :param node_two: The second node ID or symbol.
+        :return: True if both nodes are in the network and in the same component.
+        """
+        if isinstance(node_one, str):
+            node_one = self.node_ids(node_one)[0]
+        if isinstance(node_two, str):
+            node_two = self.node_ids(node_two)[0]
+        if node_one < 0 or node_two < 0:
+            return False
+        labels = self.component_labels()
+        return bool(labels[node_one] == labels[node_two])
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Shortest Path Methods         #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    @staticmethod
+    def protein_pairs(protein_list) -> list:
+        """
+        Generates all the unique pairs of proteins within a list, in the order of the nested loop over the list.
+
+        :param protein_list: The list of proteins.
+        :return: A list of (protein one, protein two) tuples.
+        """
+        proteins = np.asarray(protein_list, dtype=object)
+        firsts, seconds = np.triu_indices(len(proteins), k=1)
+        return list(zip(proteins[firsts], proteins[seconds]))
+
+    def _bfs_levels(self, sources: np.ndarray, targets: np.ndarray):
+        # Yields the (level, source rows, reached target positions, source bits) of each BFS level of each batch,
+        # where the bool source bits mark which sources of the batch newly reached each target at that level
+        # Only the current frontier and visited words are held, so memory stays O(nodes) per batch
+
+        # Only search from the sources sharing a component with any target, grouped by component
+        labels = self.component_labels()
+        target_labels = labels[targets]
+        target_label_counts = np.bincount(target_labels, minlength=len(self.component_sizes()))
+        searched = np.flatnonzero(target_label_counts[labels[sources]] > 0)
+        search_order = searched[np.argsort(labels[sources[searched]], kind='stable')]
+
+        # Neighbour segments of the nodes with any neighbours, for the OR reduction over each row
+        indptr, indices = self.adjacency.indptr, self.adjacency.indices
+        connected_rows = np.flatnonzero(np.diff(indptr))
+        shifts = np.arange(64, dtype=np.uint64)
+
+        def reached_bits(frontier, batch_size):
+            # Unpacks the source bits of the targets in the frontier
+            reached = frontier[targets]
+            reached_targets = np.flatnonzero(reached)
+            source_bits = (
+                (reached[reached_targets, np.newaxis] >> shifts[:batch_size]) & np.uint64(1)
+            ).astype(bool)
+            return reached_targets, source_bits
+
+        for batch_start in range(0, len(search_order), 64):
+            batch_rows = search_order[batch_start:batch_start + 64]
+            batch = sources[batch_rows]
+            batch_bits = np.left_shift(np.uint64(1), shifts[:len(batch)])
+
+            # Bits of the sources each target can be reached from
+            label_bits = np.zeros(len(target_label_counts), dtype=np.uint64)
+            np.bitwise_or.at(label_bits, labels[batch], batch_bits)
+            reachable_bits = label_bits[target_labels]
+
+            # Each source starts on its own bit at distance zero
+            visited = np.zeros(self.node_count, dtype=np.uint64)
+            np.bitwise_or.at(visited, batch, batch_bits)
+            frontier = visited.copy()
+            yield (0, batch_rows) + reached_bits(frontier, len(batch))
+
+            level = 0
+            while frontier.any() and not np.all(visited[targets] == reachable_bits):
+                # Every node reached by any frontier neighbour, per source bit
+                reached = np.zeros(self.node_count, dtype=np.uint64)
+                if len(indices) > 0:
+                    reached[connected_rows] = np.bitwise_or.reduceat(frontier[indices], indptr[connected_rows])
+
+                frontier = reached & ~visited
+                visited |= frontier
+                level += 1
+                yield (level, batch_rows) + reached_bits(frontier, len(batch))
+
+    def bfs_distances(self, sources, targets=None) -> np.ndarray:
+        """
+        Computes the shortest path lengths from every source to every target with one BFS per source.
+
+        The searches are bit-parallel: 64 sources share a uint64 word per node, so every BFS level of a batch of
+        sources is one gather and bitwise OR over the CSR neighbours of all nodes.
+        Targets in another component of a source are known to be unreachable from the component labels,
+        so sources without any target in their component are never searched, the sources are batched by component,
+        and a batch stops as soon as each of its sources has reached every target of its component.
+
+        :param sources: The source node IDs.
+        :param targets: The target node IDs. Defaults to all nodes.
+        :return: An int32 matrix of the path length from each source (rows) to each target (columns),
+            unreachable_distance where the target is in another component.
+        """
+        sources = np.atleast_1d(np.asarray(sources, dtype=np.int64))
+        if targets is None:
+            targets = np.arange(self.node_count)
+        targets = np.atleast_1d(np.asarray(targets, dtype=np.int64))
+        distances = np.full((len(sources), len(targets)), self.unreachable_distance, dtype=np.int32)
+
+        # Write the level of every target newly reached by a source
+        for level, batch_rows, reached_targets, source_bits in self._bfs_levels(sources, targets):
+            target_positions, batch_positions = np.nonzero(source_bits)
+            distances[batch_rows[batch_positions], reached_targets[target_positions]] = level
+
+        return distances
+
+    def path_length_histogram(self, symbols) -> dict:
+        """
+        Counts the shortest path lengths of every unique pair of proteins in a list, as the histogram of the lengths.
+
+        A bit-parallel BFS (see bfs_distances) runs from each distinct protein of the list, and at every level the
+        newly reached proteins of the list are counted against their sources, weighted by how often each protein
+        appears in the list. No pair or distance matrix is ever built, so memory stays O(nodes + list length).
+
+        :param symbols: The list of protein symbols.
+        :return: A dict of the 'histogram' Series of the number of 'Pairs' at each 'Path_Length' from 0 to the
+            longest, the number of 'unreachable_pairs' in different components, the number of 'missing_pairs' with
+            a protein missing from the network, and the total number of 'pairs'.
+        """
+        node_ids = self.node_ids(symbols)
+        list_length = len(node_ids)
+        pair_count = list_length * (list_length - 1) // 2
+
+        # Distinct proteins of the list in the network, weighted by their number of list positions
+        distinct_ids, multiplicities = np.unique(node_ids[node_ids >= 0], return_counts=True)
+        present = int(multiplicities.sum())
+        missing_pairs = pair_count - present * (present - 1) // 2
+
+        # Ordered pairs of list positions reached at each level
+        ordered_counts = np.zeros(1, dtype=np.int64)
+        for level, batch_rows, reached_targets, source_bits in self._bfs_levels(distinct_ids, distinct_ids):
+            if len(reached_targets) == 0:
+                continue
+            level_count = int(
+                multiplicities[reached_targets] @ source_bits.astype(np.int64) @ multiplicities[batch_rows]
+            )
+            if level >= len(ordered_counts):
+                ordered_counts = np.append(ordered_counts, np.zeros(level + 1 - len(ordered_counts), dtype=np.int64))
+            ordered_counts[level] += level_count
+
+        # A position is not paired with itself, and each unordered pair was reached from both ends
+        ordered_counts[0] -= present
+        pair_lengths = ordered_counts // 2
+
+        return {
+            'histogram': pd.Series(
+                pair_lengths, index=pd.RangeIndex(len(pair_lengths), name='Path_Length'), name='Pairs'
+            ),
+            'unreachable_pairs': int(pair_count - missing_pairs - pair_lengths.sum()),
+            'missing_pairs': int(missing_pairs),
+            'pairs': int(pair_count)
+        }
+
+    @staticmethod
+    def histogram_mann_whitney(histogram_one: pd.Series, histogram_two: pd.Series) -> tuple:
+        """
+        Runs the two-sided Wilcoxon rank-sum (Mann-Whitney U) test between two path length histograms
+        straight from their counts, with the tie-corrected normal approximation and continuity correction
+        that scipy.stats.mannwhitneyu uses for tied samples. Every length is one tie group, so no sample is expanded.
+
+        :param histogram_one: The number of pairs at each path length of the first list.
+        :param histogram_two: The number of pairs at each path length of the second list.
+        :return: A tuple of the U statistic of the first histogram and the two-sided p value.
+        """
+        counts = pd.concat([histogram_one, histogram_two], axis=1).fillna(0).sort_index().to_numpy(dtype=float)
+        counts_one, counts_two = counts[:, 0], counts[:, 1]
+        size_one, size_two = counts_one.sum(), counts_two.sum()
+        size = size_one + size_two
+
+        # Midrank of each tied path length in the combined sample
+        tie_sizes = counts_one + counts_two
+        midranks = np.cumsum(tie_sizes) - (tie_sizes - 1) / 2
+        u_one = np.sum(counts_one * midranks) - size_one * (size_one + 1) / 2
+
+        # Normal approximation with the tie correction, on the larger of the two U statistics
+        mean_u = size_one * size_two / 2
+        tie_term = np.sum(tie_sizes ** 3 - tie_sizes) / (size * (size - 1))
+        std_u = np.sqrt(size_one * size_two / 12 * ((size + 1) - tie_term))
+        z = (max(u_one, size_one * size_two - u_one) - mean_u - 0.5) / std_u
+        p_value = min(1.0, 2 * stats.norm.sf(z))
+
+        return float(u_one), float(p_value)
+
+    def distance_matrix(self, symbols) -> np.ndarray:
+        """
+        Computes the shortest path lengths between every pair of proteins in a list, with one BFS per distinct protein.
+
+        :param symbols: The list of protein symbols.
+        :return: An int32 matrix of the path length between the proteins at each pair of list positions,
+            unreachable_distance where the proteins are in different components
+            and missing_distance where either protein is not in the network.
+        """
+        node_ids = self.node_ids(symbols)
+        in_network = node_ids >= 0
+
+        # Search once from each distinct protein in the network
+        distinct_ids, positions = np.unique(node_ids[in_network], return_inverse=True)
+        distinct_distances = self.bfs_distances(distinct_ids, distinct_ids)
+
+        distances = np.full((len(node_ids), len(node_ids)), self.missing_distance, dtype=np.int32)
+        distances[np.ix_(in_network, in_network)] = distinct_distances[np.ix_(positions, positions)]
+        return distances
+
+    def path_lengths(self, pair_list) -> dict:
+        """
+        Computes the shortest path length of every protein pair from one batched search over the distinct proteins.
+        Pairs with a protein that is not in the network are skipped,
+        and pairs of proteins in different components get the unreachable_distance sentinel as their length.
+
+        :param pair_list: A list of (protein one, protein two) tuples.
+        :return: A dict of the 'path_lengths' dict of each pair tuple to its path length,
+            the 'distances' matrix between the 'proteins' of the pairs in order of first appearance,
+            and the number of 'unreachable_pairs' and 'missing_pairs'.
+        """
+        pair_array = np.asarray(pair_list, dtype=object).reshape(-1, 2)
+        proteins = pd.unique(pair_array.ravel())
+        distances = self.distance_matrix(proteins)
+
+        # Read the length of each pair from the distance matrix
+        protein_index = pd.Index(proteins)
+        lengths = distances[protein_index.get_indexer(pair_array[:, 0]), protein_index.get_indexer(pair_array[:, 1])]
+
+        path_lengths = {
+            (protein_one, protein_two): int(length)
+            for protein_one, protein_two, length in zip(pair_array[:, 0], pair_array[:, 1], lengths)
+            if length != self.missing_distance
+        }
+
+        return {
+            'path_lengths': path_lengths,
+            'distances': distances,
+            'proteins': proteins,
+            'unreachable_pairs': int(np.sum(lengths == self.unreachable_distance)),
+            'missing_pairs': int(np.sum(lengths == self.missing_distance))
+        }
+
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+    #  Centrality Methods            #
+    # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ #
+
+    def _pattern(self) -> sparse.csr_matrix:
+        # Returns the adjacency with every distinct neighbour weighted 1, so products count shortest paths
+        return sparse.csr_matrix(
+            (np.ones(len(self.adjacency.indices)), self.adjacency.indices, self.adjacency.indptr),
+            shape=self.adjacency.shape
+        )
+
+    @staticmethod
+    def brandes_sources(pattern: sparse.csr_matrix, sources: np.ndarray, dependencies: bool = True) -> dict:
+        """
+        Runs Brandes' shortest path counting from a chunk of sources, as run by each centrality worker.
+
+        The sources are searched together in batches: each BFS level is one sparse product of the frontier path
+        counts of every source of the batch with the adjacency pattern, so the work per source is bounded by the
+        edges of its component. The dependencies are then accumulated back level by level the same way.
+
+        :param pattern: The CSR adjacency pattern with every distinct neighbour weighted 1.
+        :param sources: The node IDs to search from.
+        :param dependencies: If True, accumulates the dependencies of every node on the sources for betweenness.
+            If False, only the distances are summed for closeness.
+        :return: A dict of the summed 'dependencies' of every node ID on the sources (zeros if not accumulated),
+            and per source, the 'distance_sums' to the nodes it reaches and the 'reached' node counts with itself.
+        """
+        node_count = pattern.shape[0]
+        sources = np.asarray(sources, dtype=np.int64)
+        batch_size = max(1, PPINetwork.max_centrality_cells // max(node_count, 1))
+
+        dependency_sums = np.zeros(node_count)
+        distance_sums = np.zeros(len(sources), dtype=np.int64)
+        reached = np.zeros(len(sources), dtype=np.int64)
+
+        for batch_start in range(0, len(sources), batch_size):
+            batch = sources[batch_start:batch_start + batch_size]
+            shape = (len(batch), node_count)
+            rows = np.arange(len(batch))
+
+            distances = np.full(shape, -1, dtype=np.int32)
+            path_counts = np.zeros(shape)
+            distances[rows, batch] = 0
+            path_counts[rows, batch] = 1
+
+            # Forward BFS: the path counts of the next level are the sums over its frontier neighbours
+            levels = [(rows, batch)]
+            frontier = sparse.csr_matrix((np.ones(len(batch)), (rows, batch)), shape=shape)
+            while True:
+                reached_next = (frontier @ pattern).tocoo()
+                unvisited = distances[reached_next.row, reached_next.col] < 0
+                level_rows, level_nodes = reached_next.row[unvisited], reached_next.col[unvisited]
+                if len(level_rows) == 0:
+                    break
+                distances[level_rows, level_nodes] = len(levels)
+                path_counts[level_rows, level_nodes] = reached_next.data[unvisited]
+                levels.append((level_rows, level_nodes))
+                frontier = sparse.csr_matrix((reached_next.data[unvisited], (level_rows, level_nodes)), shape=shape)
+
+            distance_sums[batch_start:batch_start + len(batch)] = np.where(distances > 0, distances, 0).sum(axis=1)
+            reached[batch_start:batch_start + len(batch)] = (distances >= 0).sum(axis=1)
+            if not dependencies:
+                continue
+
+            # Backward accumulation: each node passes (1 + its dependency) / its path count to its predecessors
+            node_dependencies = np.zeros(shape)
+            for level in range(len(levels) - 1, 0, -1):
+                level_rows, level_nodes = levels[level]
+                shares = (1 + node_dependencies[level_rows, level_nodes]) / path_counts[level_rows, level_nodes]
+                passed = (sparse.csr_matrix((shares, (level_rows, level_nodes)), shape=shape) @ pattern).tocoo()
+                predecessor = distances[passed.row, passed.col] == level - 1
+                predecessor_rows, predecessor_nodes = passed.row[predecessor], passed.col[predecessor]
+                node_dependencies[predecessor_rows, predecessor_nodes] += (
+                    path_counts[predecessor_rows, predecessor_nodes] * passed.data[predecessor]
+                )
+
+            node_dependencies[rows, batch] = 0
+            dependency_sums += node_dependencies.sum(axis=0)
+
+        return {'dependencies': dependency_sums, 'distance_sums': distance_sums, 'reached': reached}
+
+    def _brandes(self, sources: np.ndarray, dependencies: bool = True, max_workers: int = None) -> dict:
+        # Splits the sources into chunks searched across a process pool, then merges the chunk results in order
+        pattern = self._pattern()
+        if max_workers == 1 or len(sources) <= 1:
+            return self.brandes_sources(pattern, sources, dependencies)
+
+        worker_count = max_workers or os.cpu_count() or 1
+        chunks = [chunk for chunk in np.array_split(sources, 4 * worker_count) if len(chunk)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(PPINetwork.brandes_sources, pattern, chunk, dependencies) for chunk in chunks]
+            results = [future.result() for future in futures]
+
+        return {
+            'dependencies': np.sum([result['dependencies'] for result in results], axis=0),
+            'distance_sums': np.concatenate([result['distance_sums'] for result in results]),
+            'reached': np.concatenate([result['reached'] for result in results])
+        }
+
+    def betweenness_centrality(
+            self,
+            pivots: int = None,
+            normalized: bool = True,
+            confidence: float = 0.95,
+            max_workers: int = None,
+            seed=None
+    ) -> dict:
+        """
+        Computes the shortest path betweenness centrality of every node by Brandes' algorithm on the CSR core.
+
+        The exact mode searches from every node. The sampled mode searches from k uniformly drawn pivot nodes and
+        scales their dependencies by n / k, an unbiased estimate whose normalized error is at most
+        (n / (n - 1)) * sqrt(ln(2n / (1 - confidence)) / 2k) for all nodes at once with the given confidence
+        (Hoeffding's inequality with a union bound over the nodes).
+
+        :param pivots: The number k of sampled pivot sources. Defaults to the exact betweenness from every node.
+        :param normalized: If True, divides by the (n - 1)(n - 2) ordered pairs of other nodes as networkx does.
+            If False, counts every unordered pair once.
+        :param confidence: The probability that every sampled estimate is within the error bound.
+        :param max_workers: The number of worker processes. Defaults to the CPU count; 1 runs in this process.
+        :param seed: The seed of the random generator drawing the pivots.
+        :return: A dict of the 'betweenness' Series indexed by 'Node', the 'pivots' searched from, and the
+            'error_bound' on every value at the confidence (0 when exact), in the same scale as the values.
+        """
+        node_count = self.node_count
+        if pivots is None or pivots >= node_count:
+            sources = np.arange(node_count)
+        else:
+            sources = np.sort(np.random.default_rng(seed).choice(node_count, size=pivots, replace=False))
+
+        betweenness = self._brandes(sources, True, max_workers)['dependencies'] * (node_count / max(len(sources), 1))
+
+        # Each unordered pair was counted from both of its ends
+        if normalized:
+            scale = 1 / ((node_count - 1) * (node_count - 2)) if node_count > 2 else 1.0
+        else:
+            scale = 0.5
+
+        error_bound = 0.0
+        if 0 < len(sources) < node_count and node_count > 2:
+            error_bound = (node_count / (node_count - 1)) * np.sqrt(
+                np.log(2 * node_count / (1 - confidence)) / (2 * len(sources))
+            )
+            if not normalized:
+                error_bound *= (node_count - 1) * (node_count - 2) / 2
+
+        return {
+            'betweenness': pd.Series(
+                betweenness * scale, index=pd.Index(self.symbols, name='Node'), name='Betweenness'
+            ),
+            'pivots': len(sources),
+            'error_bound': float(error_bound)
+        }
+
+    def closeness_centrality(self, max_workers: int = None) -> pd.Series:
+        """
+        Computes the closeness centrality of every node from BFS distance sums, searched across a process pool.
+        As in networkx, the closeness within a component is scaled by the fraction of the other nodes it reaches
+        (Wasserman and Faust), so nodes of small components do not rank as central.
+
+        :param max_workers: The number of worker processes. Defaults to the CPU count; 1 runs in this process.
+        :return: A Series of the 'Closeness' of each node, indexed by 'Node'.
+        """
+        node_count = self.node_count
+        searched = self._brandes(np.arange(node_count), False, max_workers)
+        others_reached = searched['reached'] - 1
+        distance_sums = searched['distance_sums']
+
+        closeness = np.divide(
+            others_reached.astype(float) ** 2, distance_sums * max(node_count - 1, 1),
+            out=np.zeros(node_count), where=distance_sums > 0
+        )
+        return pd.Series(closeness, index=pd.Index(self.symbols, name='Node'), name='Closeness')
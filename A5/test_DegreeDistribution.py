@@ -0,0 +1,14 @@
+# Import Libraries
+import numpy as np  # Computation
+from DegreeDistribution import DegreeDistribution  # Degree Distribution and Power-Law Fitting Class
+
+
+def test_fit_power_law_recovers_pure_zipf_sample():
+    # Every degree of a pure Zipf sample is in the power-law tail, so the scan should keep x_min at 1
+    degrees = np.random.default_rng(0).zipf(2.5, 50000)
+
+    fit = DegreeDistribution.fit_power_law(degrees)
+
+    assert fit['x_min'] == 1
+    assert abs(fit['alpha'] - 2.5) < 0.02
+    assert fit['ks'] < 0.005